@@ -20,9 +20,13 @@ __version__ = "1.0.0"
 __author__ = "Claude Code Team"
 __license__ = "MIT"
 
-from claude_bedrock_cursor.auth.oauth import OAuthManager
-from claude_bedrock_cursor.bedrock.client import BedrockClient
-from claude_bedrock_cursor.config import Config
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from claude_bedrock_cursor.auth.oauth import OAuthManager
+    from claude_bedrock_cursor.bedrock.client import BedrockClient
+    from claude_bedrock_cursor.config import Config
 
 __all__ = [
     "BedrockClient",
@@ -30,3 +34,31 @@ __all__ = [
     "OAuthManager",
     "__version__",
 ]
+
+# Public names resolved on first access, so importing the package (e.g. for
+# __version__) doesn't pull in boto3 or httpx
+_LAZY_EXPORTS = {
+    "BedrockClient": "claude_bedrock_cursor.bedrock.client",
+    "Config": "claude_bedrock_cursor.config",
+    "OAuthManager": "claude_bedrock_cursor.auth.oauth",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The exported object
+
+    Raises:
+        AttributeError: If the name is not exported
+    """
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,18 @@
 """OAuth2 authentication manager with refresh token rotation."""
 
-import subprocess  # nosec B404 - Used safely to call claude CLI command
+import asyncio
+import atexit
+import base64
+import shutil
 import time
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx
+import orjson
 
 from claude_bedrock_cursor.auth.storage import SecureTokenStorage
 from claude_bedrock_cursor.utils.errors import (
@@ -17,11 +21,111 @@ from claude_bedrock_cursor.utils.errors import (
     TokenRefreshError,
 )
 
+# Process-wide HTTP client so token refreshes reuse pooled keep-alive connections;
+# HTTP/2 lets login, refresh and revoke share one multiplexed connection
+_SHARED_CLIENT: httpx.AsyncClient | None = None
 
-@dataclass
+# Event loop the shared client's pooled connections belong to; None until the
+# client is first used inside a running loop
+_SHARED_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the shared OAuth HTTP client for the running event loop.
+
+    Pooled connections belong to the loop that opened them, so a client
+    bound to another loop (e.g. an earlier ``asyncio.run``) is replaced.
+    Outside a running loop the current client is returned unbound.
+
+    Returns:
+        httpx.AsyncClient: Long-lived client with connection pooling
+    """
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if (
+        _SHARED_CLIENT is None
+        or _SHARED_CLIENT.is_closed
+        or _SHARED_CLIENT_LOOP not in (None, loop)
+    ):
+        # A client left on a finished loop can't be closed from this one
+        _SHARED_CLIENT_LOOP = None
+        _SHARED_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=20,
+                keepalive_expiry=30,
+            ),
+        )
+    if _SHARED_CLIENT_LOOP is None:
+        _SHARED_CLIENT_LOOP = loop
+    return _SHARED_CLIENT
+
+
+async def close_shared_client() -> None:
+    """Close the shared OAuth HTTP client if it was created.
+
+    The default manager is bound to that client, so it is dropped too and
+    its proactive refresh cancelled.
+    """
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP, _default_manager
+    global _default_manager_loop
+    if _default_manager is not None:
+        _default_manager._cancel_refresh_task()
+        _default_manager = _default_manager_loop = None
+    if _SHARED_CLIENT is not None:
+        client, _SHARED_CLIENT, _SHARED_CLIENT_LOOP = _SHARED_CLIENT, None, None
+        await client.aclose()
+
+
+@atexit.register
+def _close_shared_client_at_exit() -> None:
+    """Best-effort close of the shared client on interpreter shutdown."""
+    if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+        with suppress(Exception):
+            asyncio.run(close_shared_client())
+
+
+def _jwt_expiry(token: str) -> int | None:
+    """Read the ``exp`` claim of a JWT without verifying its signature.
+
+    Args:
+        token: Access token, possibly a JWT
+
+    Returns:
+        int: Unix expiry timestamp, or None if the token carries none
+    """
+    if not token.startswith("eyJ"):
+        return None
+
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+
+    payload = parts[1]
+    try:
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except ValueError:
+        return None
+
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return int(exp) if isinstance(exp, int | float) else None
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class TokenPair:
     """Access and refresh token pair.
 
+    Immutable so a pair handed out after rotation can't be altered in place.
+    Compared by identity: each issued pair is a distinct credential.
+
     Attributes:
         access_token: Short-lived access token (5 minutes)
         refresh_token: Long-lived refresh token (7 days)
@@ -32,6 +136,17 @@ class TokenPair:
     refresh_token: str
     expires_at: int
 
+    def needs_refresh(self, skew: float) -> bool:
+        """Check whether the access token expires within ``skew`` seconds.
+
+        Args:
+            skew: Seconds before expiry at which a refresh is due
+
+        Returns:
+            bool: True if the access token should be refreshed
+        """
+        return self.expires_at - time.time() < skew
+
 
 class OAuthManager:
     """OAuth2 manager with automatic token rotation.
@@ -53,14 +168,85 @@ class OAuthManager:
     ACCESS_TOKEN_LIFETIME = 300  # 5 minutes
     REFRESH_TOKEN_LIFETIME = 604800  # 7 days
 
+    # Refresh this many seconds before the access token actually expires
+    REFRESH_SKEW = max(60, int(ACCESS_TOKEN_LIFETIME * 0.2))
+
+    # Seconds ahead of REFRESH_SKEW at which a proactive refresh fires, so
+    # requests never see a token that is already due
+    PROACTIVE_REFRESH_LEAD = 30
+
+    # Window in which a just-rotated pair is handed to concurrent refreshers
+    REFRESH_GRACE = 60
+
+    # Single-flight refresh state, shared by all managers in the process
+    _refresh_lock: asyncio.Lock | None = None
+    _refresh_lock_loop: asyncio.AbstractEventLoop | None = None
+    _last_refresh: TokenPair | None = None
+    _last_refresh_at: float = 0.0
+
+    # Label preceding the token in `claude setup-token` output
+    OAUTH_TOKEN_MARKER = "OAuth token:"  # nosec B105 - Not a password, output label
+
+    # Absolute path of the claude CLI, resolved once per process
+    _CLAUDE_PATH: str | None = None
+
+    # Seconds to wait for `claude setup-token` to finish
+    SETUP_TOKEN_TIMEOUT = 60
+
     # API endpoints (placeholder - update with actual endpoints)
     TOKEN_ENDPOINT = "https://api.anthropic.com/v1/oauth/token"  # nosec B105 - Not a password, API endpoint URL
     REVOKE_ENDPOINT = "https://api.anthropic.com/v1/oauth/revoke"
 
-    def __init__(self) -> None:
-        """Initialize OAuth manager."""
+    # Seconds drain() waits for background token revocations
+    REVOKE_DRAIN_TIMEOUT = 2.0
+
+    # Request headers for the pre-serialized JSON bodies sent by _post_json
+    JSON_HEADERS: ClassVar[dict[str, str]] = {"content-type": "application/json"}
+
+    def __init__(
+        self, owns_client: bool = False, proactive_refresh: bool = False
+    ) -> None:
+        """Initialize OAuth manager.
+
+        Args:
+            owns_client: Use a private HTTP client closed on context exit
+                instead of the shared process-wide client
+            proactive_refresh: Refresh in the background shortly before the
+                cached access token is due, for long-lived managers
+        """
         self.storage = SecureTokenStorage()
-        self.client = httpx.AsyncClient(timeout=10.0)
+        self.owns_client = owns_client
+        # Private client, or None to resolve the shared one on each use
+        self._client = httpx.AsyncClient(timeout=10.0) if owns_client else None
+        self._pending_revokes: set[asyncio.Task[None]] = set()
+        # Last pair loaded or issued; serves get_valid_access_token until due
+        self._token_cache: TokenPair | None = None
+        self.proactive_refresh = proactive_refresh
+        self._refresh_task: asyncio.Task[None] | None = None
+        # Token from `claude setup-token`, reused until rejected or logout
+        self._oauth_token: str | None = None
+        self._oauth_token_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for OAuth requests.
+
+        Without a private client this is the shared client for the running
+        event loop, looked up on every use so the manager can outlive a loop.
+
+        Returns:
+            httpx.AsyncClient: Client to send requests with
+        """
+        return self._client if self._client is not None else get_shared_client()
+
+    @client.setter
+    def client(self, client: httpx.AsyncClient) -> None:
+        """Use a specific client instead of the shared one.
+
+        Args:
+            client: Client to send requests with
+        """
+        self._client = client
 
     async def login(self) -> TokenPair:
         """Perform OAuth login via Claude Code.
@@ -76,16 +262,23 @@ class OAuthManager:
             >>> tokens = await manager.login()
             >>> print("Login successful!")
         """
-        # Step 1: Get OAuth token from Claude Code CLI
-        oauth_token = await self._get_claude_oauth_token()
+        # Step 1: Get OAuth token from Claude Code CLI (at most once)
+        oauth_token = await self._claude_oauth_token()
 
         # Step 2: Exchange OAuth token for token pair
-        tokens = await self._exchange_oauth_token(oauth_token)
+        try:
+            tokens = await self._exchange_oauth_token(oauth_token)
+        except AuthenticationError:
+            # Rejected token; the next login asks the CLI for a new one
+            self._oauth_token = None
+            raise
 
         # Step 3: Store tokens securely
-        self.storage.store_token("access_token", tokens.access_token)
-        self.storage.store_token("refresh_token", tokens.refresh_token)
-        self.storage.store_token("oauth_token", oauth_token)
+        await asyncio.gather(
+            self._store_token_pair(tokens),
+            self.storage.astore_token("oauth_token", oauth_token),
+        )
+        self._cache_tokens(tokens)
 
         return tokens
 
@@ -99,6 +292,10 @@ class OAuthManager:
         4. Invalidate old refresh token
         5. Store new tokens
 
+        Concurrent callers are serialized; a caller that waited on a refresh
+        which already rotated its token receives that pair instead of
+        posting the now-invalid refresh token again.
+
         Returns:
             TokenPair: New access and refresh tokens
 
@@ -111,52 +308,71 @@ class OAuthManager:
             >>> tokens = await manager.refresh_access_token()
             >>> print("Token refreshed!")
         """
-        current_refresh = self.storage.get_token("refresh_token")
+        # Uncached: another process may have rotated the token since we read it
+        current_refresh = await self.storage.aget_token("refresh_token", fresh=True)
         if not current_refresh:
             raise NotAuthenticatedError(
                 "No refresh token found. Please run: claude-bedrock auth login"
             )
 
-        try:
-            # Exchange refresh token for new token pair
-            response = await self.client.post(
-                self.TOKEN_ENDPOINT,
-                json={
-                    "grant_type": "refresh_token",
-                    "refresh_token": current_refresh,
-                },
-            )
-            response.raise_for_status()
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                # Refresh token expired or invalid
-                self.storage.clear_all()
-                raise NotAuthenticatedError(
-                    "Refresh token expired. Please run: claude-bedrock auth login"
+        async with self._get_refresh_lock():
+            # Another coroutine may have rotated the token while we waited
+            coalesced = await self._coalesced_refresh(current_refresh)
+            if coalesced is not None:
+                self._cache_tokens(coalesced)
+                return coalesced
+
+            try:
+                # Exchange refresh token for new token pair
+                response = await self._post_json(
+                    self.TOKEN_ENDPOINT,
+                    {"grant_type": "refresh_token", "refresh_token": current_refresh},
+                )
+                response.raise_for_status()
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 401:
+                    # Refresh token expired or invalid
+                    self._drop_tokens()
+                    self._forget_last_refresh()
+                    # Keep tokens another process rotated in the meantime
+                    stored = await self.storage.aget_token("refresh_token", fresh=True)
+                    if stored == current_refresh:
+                        await self.storage.clear_all_async()
+                    raise NotAuthenticatedError(
+                        "Refresh token expired. Please run: claude-bedrock auth login"
+                    ) from e
+                raise TokenRefreshError(
+                    f"Token refresh failed: {e.response.text}"
                 ) from e
-            raise TokenRefreshError(f"Token refresh failed: {e.response.text}") from e
 
-        except httpx.HTTPError as e:
-            raise TokenRefreshError(f"Token refresh failed: {e}") from e
+            except httpx.HTTPError as e:
+                raise TokenRefreshError(f"Token refresh failed: {e}") from e
 
-        data = response.json()
+            data = orjson.loads(response.content)
 
-        new_tokens = TokenPair(
-            access_token=data["access_token"],
-            refresh_token=data["refresh_token"],  # NEW refresh token!
-            expires_at=int(time.time()) + self.ACCESS_TOKEN_LIFETIME,
-        )
+            new_tokens = TokenPair(
+                access_token=data["access_token"],
+                refresh_token=data["refresh_token"],  # NEW refresh token!
+                expires_at=self._expiry_from_response(data),
+            )
 
-        # Store new tokens (old refresh token is now invalid)
-        self.storage.store_token("access_token", new_tokens.access_token)
-        self.storage.store_token("refresh_token", new_tokens.refresh_token)
+            # Store new tokens (old refresh token is now invalid)
+            await self._store_token_pair(new_tokens)
+            self._cache_tokens(new_tokens)
+            OAuthManager._last_refresh = new_tokens
+            OAuthManager._last_refresh_at = time.time()
 
-        return new_tokens
+            return new_tokens
 
     async def get_valid_access_token(self) -> str:
         """Get valid access token, refreshing if needed.
 
+        The token is refreshed proactively when it expires within
+        ``REFRESH_SKEW`` seconds, so callers rarely hit a 401. Until then the
+        pair this manager last loaded or issued is returned without touching
+        storage.
+
         Returns:
             str: Valid access token
 
@@ -168,46 +384,85 @@ class OAuthManager:
             >>> token = await manager.get_valid_access_token()
             >>> # Use token for API calls
         """
-        access_token = self.storage.get_token("access_token")
+        cached = self._token_cache
+        if cached is not None and not cached.needs_refresh(self.REFRESH_SKEW):
+            return cached.access_token
+
+        # Cold load: the three keyring reads overlap instead of running serially
+        access_token, expires_at, refresh_token = await asyncio.gather(
+            self.storage.aget_token("access_token"),
+            self.storage.aget_token("access_token_expires_at"),
+            self.storage.aget_token("refresh_token"),
+        )
 
         if not access_token:
             raise NotAuthenticatedError(
                 "Not authenticated. Please run: claude-bedrock auth login"
             )
 
-        # For production: store expires_at and check if token is expired
-        # For now: return token and refresh on 401 errors
+        # Tokens stored before expiry tracking was added have no timestamp;
+        # those fall back to refreshing on 401 errors and are never cached
+        if expires_at is None:
+            return access_token
+        if int(expires_at) - time.time() < self.REFRESH_SKEW:
+            tokens = await self.refresh_access_token()
+            return tokens.access_token
 
+        if refresh_token:
+            self._cache_tokens(TokenPair(access_token, refresh_token, int(expires_at)))
         return access_token
 
     async def logout(self) -> None:
         """Logout and clear all tokens.
 
-        Revokes tokens on server and clears local storage.
+        Clears local storage immediately and revokes the refresh token on the
+        server in the background. Call ``drain()`` before the event loop
+        exits to give the revocation a chance to complete.
 
         Example:
             >>> manager = OAuthManager()
             >>> await manager.logout()
             >>> print("Logged out successfully!")
+            >>> await manager.drain()
         """
-        refresh_token = self.storage.get_token("refresh_token")
+        refresh_token = await self.storage.aget_token("refresh_token")
 
-        # Revoke token on server
+        # Revoke token on server without holding up the logout
         if refresh_token:
-            with suppress(httpx.HTTPError):
-                await self.client.post(
-                    self.REVOKE_ENDPOINT,
-                    json={"token": refresh_token},
-                    timeout=5.0,
-                )
-            # Server revocation failed, still clear local storage
+            task = asyncio.create_task(self._best_effort_revoke(refresh_token))
+            self._pending_revokes.add(task)
+            task.add_done_callback(self._pending_revokes.discard)
 
         # Clear local token storage
-        self.storage.clear_all()
+        self._oauth_token = None
+        self._drop_tokens()
+        self._forget_last_refresh()
+        await self.storage.clear_all_async()
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Wait for background token revocations to finish.
+
+        Revocations still running after the timeout are cancelled.
+
+        Args:
+            timeout: Seconds to wait (defaults to ``REVOKE_DRAIN_TIMEOUT``)
+        """
+        if not self._pending_revokes:
+            return
+
+        with suppress(TimeoutError):
+            await asyncio.wait_for(
+                asyncio.gather(*self._pending_revokes, return_exceptions=True),
+                timeout if timeout is not None else self.REVOKE_DRAIN_TIMEOUT,
+            )
 
     async def is_authenticated(self) -> bool:
         """Check if user is authenticated.
 
+        The refresh token is what makes a session: an expired access token
+        is replaced on the next request, but one without a refresh token
+        can't be. A pair cached by this manager answers without a probe.
+
         Returns:
             bool: True if authenticated, False otherwise
 
@@ -216,7 +471,146 @@ class OAuthManager:
             >>> if await manager.is_authenticated():
             ...     print("Already logged in!")
         """
-        return self.storage.has_token("access_token")
+        if self._token_cache is not None:
+            return True
+        return await self.storage.ahas_token("refresh_token")
+
+    @staticmethod
+    def _get_refresh_lock() -> asyncio.Lock:
+        """Get the refresh lock for the running event loop.
+
+        Returns:
+            asyncio.Lock: Lock serializing token refreshes
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            OAuthManager._refresh_lock is None
+            or OAuthManager._refresh_lock_loop is not loop
+        ):
+            OAuthManager._refresh_lock = asyncio.Lock()
+            OAuthManager._refresh_lock_loop = loop
+        return OAuthManager._refresh_lock
+
+    async def _coalesced_refresh(self, seen_refresh: str) -> TokenPair | None:
+        """Return a pair rotated by a concurrent refresh, if any.
+
+        Args:
+            seen_refresh: Refresh token the caller read before waiting
+
+        Returns:
+            TokenPair: Recently rotated pair, or None if a refresh is needed
+        """
+        cached = OAuthManager._last_refresh
+        if cached is None or cached.refresh_token == seen_refresh:
+            return None
+        if time.time() - OAuthManager._last_refresh_at > self.REFRESH_GRACE:
+            return None
+        # Only reuse it if it is still what storage holds (no login/logout since)
+        if await self.storage.aget_token("refresh_token") != cached.refresh_token:
+            return None
+        return cached
+
+    def _cache_tokens(self, tokens: TokenPair) -> None:
+        """Remember a pair for get_valid_access_token.
+
+        With ``proactive_refresh``, also (re)schedules a background refresh
+        ``PROACTIVE_REFRESH_LEAD`` seconds before the pair becomes due.
+
+        Args:
+            tokens: Pair just loaded, issued or rotated
+        """
+        self._token_cache = tokens
+        if not self.proactive_refresh:
+            return
+
+        self._cancel_refresh_task()
+        delay = (
+            tokens.expires_at
+            - self.REFRESH_SKEW
+            - self.PROACTIVE_REFRESH_LEAD
+            - time.time()
+        )
+        # Already (nearly) due: the next request refreshes on demand
+        if delay > 0:
+            self._refresh_task = asyncio.create_task(self._delayed_refresh(delay))
+
+    def _drop_tokens(self) -> None:
+        """Forget the cached pair and cancel any scheduled refresh."""
+        self._token_cache = None
+        self._cancel_refresh_task()
+
+    def _cancel_refresh_task(self) -> None:
+        """Cancel the scheduled proactive refresh, unless it is the caller."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _delayed_refresh(self, delay: float) -> None:
+        """Sleep, then refresh the token pair in the background.
+
+        Failures are ignored; the next request refreshes on demand and
+        surfaces the error there.
+
+        Args:
+            delay: Seconds to wait before refreshing
+        """
+        await asyncio.sleep(delay)
+        with suppress(AuthenticationError):
+            await self.refresh_access_token()
+
+    @staticmethod
+    def _forget_last_refresh() -> None:
+        """Drop the pair cached for concurrent refreshers."""
+        OAuthManager._last_refresh = None
+        OAuthManager._last_refresh_at = 0.0
+
+    async def _store_token_pair(self, tokens: TokenPair) -> None:
+        """Persist access token, refresh token and absolute expiry.
+
+        Args:
+            tokens: Token pair to store
+        """
+        await asyncio.gather(
+            self.storage.astore_token("access_token", tokens.access_token),
+            self.storage.astore_token("refresh_token", tokens.refresh_token),
+            self.storage.astore_token(
+                "access_token_expires_at", str(tokens.expires_at)
+            ),
+        )
+
+    async def _claude_oauth_token(self) -> str:
+        """Get the Claude Code OAuth token, running the CLI only on a miss.
+
+        Concurrent logins wait for one CLI run instead of starting their own.
+        The connection to the token endpoint is opened while the CLI runs,
+        so the exchange that follows can reuse a pooled connection; a
+        warm-up still in flight when the CLI returns is cancelled.
+
+        Returns:
+            str: OAuth token
+
+        Raises:
+            AuthenticationError: If token generation fails
+        """
+        if self._oauth_token is None:
+            async with self._oauth_token_lock:
+                if self._oauth_token is None:
+                    warm_up = asyncio.create_task(self._warm_up_connection())
+                    try:
+                        self._oauth_token = await self._get_claude_oauth_token()
+                    finally:
+                        # Only useful while the CLI runs; never delay login on it
+                        warm_up.cancel()
+        return self._oauth_token
+
+    async def _warm_up_connection(self) -> None:
+        """Open a pooled connection to the token endpoint.
+
+        Resolves DNS and completes the TLS handshake with a HEAD request whose
+        outcome is ignored; a failure here resurfaces on the real exchange.
+        """
+        with suppress(httpx.HTTPError):
+            await self.client.head(self.TOKEN_ENDPOINT)
 
     async def _get_claude_oauth_token(self) -> str:
         """Get OAuth token from Claude Code CLI.
@@ -231,37 +625,108 @@ class OAuthManager:
             Runs `claude setup-token` command and extracts token from output.
         """
         try:
-            # Run claude setup-token command
-            result = subprocess.run(  # nosec B603 B607 - Safe: calling trusted claude CLI with fixed args
-                ["claude", "setup-token"],
-                capture_output=True,
-                text=True,
-                timeout=60,
+            # Run claude setup-token without blocking the event loop
+            proc = await asyncio.create_subprocess_exec(  # nosec B603 - Safe: calling trusted claude CLI with fixed args
+                self._claude_cli_path(),
+                "setup-token",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
+        except FileNotFoundError as e:
+            raise AuthenticationError(
+                "Claude Code CLI not found. Please install: npm install -g @anthropic-ai/claude-code"
+            ) from e
 
-            if result.returncode != 0:
-                raise AuthenticationError(
-                    f"Failed to generate OAuth token: {result.stderr}"
-                )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=self.SETUP_TOKEN_TIMEOUT
+            )
+        except TimeoutError as e:
+            proc.kill()
+            await proc.wait()
+            raise AuthenticationError("OAuth token generation timed out") from e
 
-            # Extract token from output
-            # Format: "Your OAuth token: <token>"
-            output = result.stdout.strip()
-            if "OAuth token:" in output:
-                token = output.split("OAuth token:")[-1].strip()
-                return token
+        if proc.returncode != 0:
+            raise AuthenticationError(
+                f"Failed to generate OAuth token: {stderr.decode('utf-8', errors='replace')}"
+            )
 
+        # Extract token from output
+        # Format: "Your OAuth token: <token>"
+        output = stdout.decode("utf-8", errors="replace")
+        marker = output.rfind(self.OAUTH_TOKEN_MARKER)
+        if marker == -1:
             raise AuthenticationError(
-                f"Could not parse OAuth token from output: {output}"
+                f"Could not parse OAuth token from output: {output.strip()}"
             )
 
-        except subprocess.TimeoutExpired as e:
-            raise AuthenticationError("OAuth token generation timed out") from e
+        return output[marker + len(self.OAUTH_TOKEN_MARKER) :].strip()
 
-        except FileNotFoundError as e:
-            raise AuthenticationError(
-                "Claude Code CLI not found. Please install: npm install -g @anthropic-ai/claude-code"
-            ) from e
+    async def _best_effort_revoke(self, refresh_token: str) -> None:
+        """Revoke a refresh token on the server, ignoring failures.
+
+        Args:
+            refresh_token: Refresh token to revoke
+        """
+        # Local storage is cleared regardless, so server errors are ignored
+        with suppress(httpx.HTTPError):
+            await self._post_json(
+                self.REVOKE_ENDPOINT, {"token": refresh_token}, timeout=5.0
+            )
+
+    async def _post_json(
+        self, url: str, payload: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        """POST a JSON body serialized with orjson.
+
+        Sending pre-encoded ``content`` skips httpx's stdlib ``json.dumps``.
+
+        Args:
+            url: Endpoint URL
+            payload: JSON object to send
+            **kwargs: Extra arguments for ``httpx.AsyncClient.post``
+
+        Returns:
+            httpx.Response: Server response
+        """
+        return await self.client.post(
+            url, content=orjson.dumps(payload), headers=self.JSON_HEADERS, **kwargs
+        )
+
+    def _expiry_from_response(self, data: dict[str, Any]) -> int:
+        """Compute the absolute access token expiry from a token response.
+
+        Prefers the JWT ``exp`` claim, then ``expires_in``, then the default
+        ``ACCESS_TOKEN_LIFETIME``.
+
+        Args:
+            data: Token endpoint response body
+
+        Returns:
+            int: Unix timestamp when the access token expires
+        """
+        exp = _jwt_expiry(data["access_token"])
+        if exp is not None:
+            return exp
+        lifetime = data.get("expires_in", self.ACCESS_TOKEN_LIFETIME)
+        return int(time.time()) + int(lifetime)
+
+    @staticmethod
+    def _claude_cli_path() -> str:
+        """Resolve the claude CLI executable, caching the result.
+
+        Returns:
+            str: Absolute path to the claude executable
+
+        Raises:
+            FileNotFoundError: If claude is not on PATH
+        """
+        if OAuthManager._CLAUDE_PATH is None:
+            path = shutil.which("claude")
+            if path is None:
+                raise FileNotFoundError("claude")
+            OAuthManager._CLAUDE_PATH = path
+        return OAuthManager._CLAUDE_PATH
 
     async def _exchange_oauth_token(self, oauth_token: str) -> TokenPair:
         """Exchange OAuth token for access + refresh tokens.
@@ -276,12 +741,9 @@ class OAuthManager:
             AuthenticationError: If exchange fails
         """
         try:
-            response = await self.client.post(
+            response = await self._post_json(
                 self.TOKEN_ENDPOINT,
-                json={
-                    "grant_type": "authorization_code",
-                    "code": oauth_token,
-                },
+                {"grant_type": "authorization_code", "code": oauth_token},
             )
             response.raise_for_status()
 
@@ -293,12 +755,12 @@ class OAuthManager:
         except httpx.HTTPError as e:
             raise AuthenticationError(f"OAuth token exchange failed: {e}") from e
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         return TokenPair(
             access_token=data["access_token"],
             refresh_token=data["refresh_token"],
-            expires_at=int(time.time()) + self.ACCESS_TOKEN_LIFETIME,
+            expires_at=self._expiry_from_response(data),
         )
 
     async def __aenter__(self) -> "OAuthManager":
@@ -306,8 +768,44 @@ class OAuthManager:
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        await self.client.aclose()
+        """Async context manager exit.
+
+        Cancels any scheduled proactive refresh and waits for pending
+        revocations. The shared client stays open; only a privately owned
+        client is closed.
+        """
+        self._cancel_refresh_task()
+        await self.drain()
+        if self.owns_client:
+            await self.client.aclose()
+
+
+_default_manager: OAuthManager | None = None
+
+# Event loop _default_manager (and its proactive refresh task) runs on
+_default_manager_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_default_manager() -> OAuthManager:
+    """Return the OAuthManager used by ``requires_auth`` on the running loop.
+
+    It is shared by every call on one event loop, so it refreshes
+    proactively. A new loop (e.g. a later ``asyncio.run``) gets a new
+    manager, and the old one's scheduled refresh is cancelled.
+
+    Returns:
+        Lazily created manager backed by the shared HTTP client
+    """
+    global _default_manager, _default_manager_loop
+    loop = asyncio.get_running_loop()
+    if _default_manager is None or _default_manager_loop is not loop:
+        if _default_manager is not None:
+            # Its loop may already be closed, leaving nothing to cancel on
+            with suppress(RuntimeError):
+                _default_manager._cancel_refresh_task()
+        _default_manager = OAuthManager(proactive_refresh=True)
+        _default_manager_loop = loop
+    return _default_manager
 
 
 def requires_auth(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -324,7 +822,7 @@ def requires_auth(func: Callable[..., Any]) -> Callable[..., Any]:
 
     @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        oauth_manager = OAuthManager()
+        oauth_manager = _get_default_manager()
 
         try:
             # Try with current token
@@ -338,7 +836,4 @@ def requires_auth(func: Callable[..., Any]) -> Callable[..., Any]:
                 return await func(*args, access_token=tokens.access_token, **kwargs)
             raise
 
-        finally:
-            await oauth_manager.client.aclose()
-
     return wrapper
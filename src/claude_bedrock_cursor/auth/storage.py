@@ -1,5 +1,8 @@
 """Secure token storage using system keyring."""
 
+import asyncio
+import time
+
 import keyring
 import keyring.errors
 
@@ -25,6 +28,28 @@ class SecureTokenStorage:
 
     SERVICE_NAME = "claude-bedrock-cursor"
 
+    # Every keyring entry this package writes
+    TOKEN_TYPES = (
+        "access_token",
+        "refresh_token",
+        "oauth_token",
+        "access_token_expires_at",
+    )
+
+    # Seconds a keyring read is served from memory before re-reading
+    CACHE_TTL = 300
+
+    # Seconds a keyring miss is remembered; short so external logins show up
+    MISS_TTL = 10
+
+    def __init__(self) -> None:
+        """Initialize storage with an empty per-instance read cache.
+
+        Misses are tracked separately with their own shorter TTL.
+        """
+        self._cache: dict[str, tuple[str, float]] = {}
+        self._misses: dict[str, float] = {}
+
     def store_token(self, token_type: str, token: str) -> None:
         """Store token in system keyring (encrypted).
 
@@ -33,22 +58,39 @@ class SecureTokenStorage:
             token: Token value to store
 
         Raises:
+            ValueError: If token_type or token is empty
             AuthenticationError: If storage fails
 
         Example:
             >>> storage = SecureTokenStorage()
             >>> storage.store_token("access_token", "my_secret_token")
         """
+        if not token_type:
+            raise ValueError("Token type cannot be empty")
+        if not token:
+            raise ValueError("Token value cannot be empty")
+
+        # A store may be a fresh login, so no recorded miss can be trusted
+        self._misses.clear()
         try:
             keyring.set_password(self.SERVICE_NAME, token_type, token)
         except keyring.errors.KeyringError as e:
+            self._invalidate(token_type)
             raise AuthenticationError(f"Failed to store token in keyring: {e}") from e
 
-    def get_token(self, token_type: str) -> str | None:
+        self._remember(token_type, token)
+
+    def get_token(self, token_type: str, fresh: bool = False) -> str | None:
         """Retrieve token from keyring.
 
+        Tokens read within the last ``CACHE_TTL`` seconds are served from
+        memory, avoiding a keyring IPC round-trip. Missing tokens are
+        likewise answered from memory for ``MISS_TTL`` seconds.
+
         Args:
             token_type: Type of token to retrieve
+            fresh: Read the keyring even on a cache hit, for values another
+                process may have changed (rotated refresh tokens)
 
         Returns:
             str: Token value if found, None otherwise
@@ -62,13 +104,60 @@ class SecureTokenStorage:
             >>> if token:
             ...     print("Token found!")
         """
+        if not fresh:
+            cached = self._cached(token_type)
+            if cached is not None or self._known_missing(token_type):
+                return cached
+
         try:
-            return keyring.get_password(self.SERVICE_NAME, token_type)
+            token = keyring.get_password(self.SERVICE_NAME, token_type)
         except keyring.errors.KeyringError as e:
             raise AuthenticationError(
                 f"Failed to retrieve token from keyring: {e}"
             ) from e
 
+        if token is None:
+            self._invalidate(token_type)
+            self._misses[token_type] = time.monotonic()
+        else:
+            self._remember(token_type, token)
+        return token
+
+    async def astore_token(self, token_type: str, token: str) -> None:
+        """Store token without blocking the event loop.
+
+        Args:
+            token_type: Type of token (access_token, refresh_token, oauth_token)
+            token: Token value to store
+
+        Raises:
+            ValueError: If token_type or token is empty
+            AuthenticationError: If storage fails
+        """
+        await asyncio.to_thread(self.store_token, token_type, token)
+
+    async def aget_token(self, token_type: str, fresh: bool = False) -> str | None:
+        """Retrieve token without blocking the event loop.
+
+        Cache hits and remembered misses return immediately; only keyring
+        reads go to a thread.
+
+        Args:
+            token_type: Type of token to retrieve
+            fresh: Read the keyring even on a cache hit
+
+        Returns:
+            str: Token value if found, None otherwise
+
+        Raises:
+            AuthenticationError: If retrieval fails
+        """
+        if not fresh:
+            cached = self._cached(token_type)
+            if cached is not None or self._known_missing(token_type):
+                return cached
+        return await asyncio.to_thread(self.get_token, token_type, fresh)
+
     def delete_token(self, token_type: str) -> None:
         """Remove token from keyring.
 
@@ -79,26 +168,39 @@ class SecureTokenStorage:
             >>> storage = SecureTokenStorage()
             >>> storage.delete_token("access_token")
         """
-        try:
-            keyring.delete_password(self.SERVICE_NAME, token_type)
-        except keyring.errors.PasswordDeleteError:
-            # Token doesn't exist, nothing to delete
-            pass
-        except keyring.errors.KeyringError as e:
-            raise AuthenticationError(
-                f"Failed to delete token from keyring: {e}"
-            ) from e
+        self._invalidate(token_type)
+        self._delete_from_keyring(token_type)
 
     def clear_all(self) -> None:
         """Clear all stored tokens.
 
+        Every token type is deleted, even one this instance recently saw
+        missing, since another process may have written it since.
+
         Example:
             >>> storage = SecureTokenStorage()
             >>> storage.clear_all()
         """
-        self.delete_token("access_token")
-        self.delete_token("refresh_token")
-        self.delete_token("oauth_token")
+        self._clear_cache()
+        for token_type in self.TOKEN_TYPES:
+            self._delete_from_keyring(token_type)
+        self._remember_all_missing()
+
+    async def clear_all_async(self) -> None:
+        """Clear all stored tokens, running the keyring deletes concurrently.
+
+        Example:
+            >>> storage = SecureTokenStorage()
+            >>> await storage.clear_all_async()
+        """
+        self._clear_cache()
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self._delete_from_keyring, token_type)
+                for token_type in self.TOKEN_TYPES
+            )
+        )
+        self._remember_all_missing()
 
     def has_token(self, token_type: str) -> bool:
         """Check if token exists in keyring.
@@ -115,3 +217,84 @@ class SecureTokenStorage:
             ...     print("Already authenticated!")
         """
         return self.get_token(token_type) is not None
+
+    async def ahas_token(self, token_type: str) -> bool:
+        """Check if token exists without blocking the event loop.
+
+        Args:
+            token_type: Type of token to check
+
+        Returns:
+            bool: True if token exists, False otherwise
+        """
+        return await self.aget_token(token_type) is not None
+
+    def _cached(self, token_type: str) -> str | None:
+        """Get a token from the read cache if it is still fresh.
+
+        Args:
+            token_type: Type of token to look up
+
+        Returns:
+            str: Cached token value, or None on a miss
+        """
+        cached = self._cache.get(token_type)
+        if cached is not None and time.monotonic() - cached[1] < self.CACHE_TTL:
+            return cached[0]
+        return None
+
+    def _known_missing(self, token_type: str) -> bool:
+        """Check whether the keyring recently reported a token as missing.
+
+        Args:
+            token_type: Type of token to look up
+
+        Returns:
+            bool: True if a miss was recorded within ``MISS_TTL`` seconds
+        """
+        missed_at = self._misses.get(token_type)
+        return missed_at is not None and time.monotonic() - missed_at < self.MISS_TTL
+
+    def _remember_all_missing(self) -> None:
+        """Record every token type as missing, e.g. right after clearing."""
+        self._misses.update(dict.fromkeys(self.TOKEN_TYPES, time.monotonic()))
+
+    def _remember(self, token_type: str, token: str) -> None:
+        """Put a token in the read cache.
+
+        Args:
+            token_type: Type of token to cache
+            token: Token value
+        """
+        self._cache[token_type] = (token, time.monotonic())
+
+    def _delete_from_keyring(self, token_type: str) -> None:
+        """Delete a keyring entry, ignoring entries that don't exist.
+
+        Args:
+            token_type: Type of token to remove
+
+        Raises:
+            AuthenticationError: If deletion fails
+        """
+        try:
+            keyring.delete_password(self.SERVICE_NAME, token_type)
+        except keyring.errors.PasswordDeleteError:
+            # Token doesn't exist, nothing to delete
+            pass
+        except keyring.errors.KeyringError as e:
+            raise AuthenticationError(
+                f"Failed to delete token from keyring: {e}"
+            ) from e
+
+    def _invalidate(self, token_type: str) -> None:
+        """Drop a token from the in-memory read cache.
+
+        Args:
+            token_type: Type of token to forget
+        """
+        self._cache.pop(token_type, None)
+
+    def _clear_cache(self) -> None:
+        """Drop every cached token."""
+        self._cache.clear()
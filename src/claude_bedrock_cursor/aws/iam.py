@@ -1,7 +1,29 @@
 """IAM policy management for AWS Bedrock."""
 
 import json
-from typing import Any
+from functools import lru_cache
+from typing import Any, ClassVar
+
+import orjson
+
+_ARN_TEMPLATE = "arn:aws:bedrock:*::foundation-model/{}".format
+
+_DEFAULT_MODEL = "anthropic.claude-sonnet-4-*"
+_DEFAULT_RESOURCES = (_ARN_TEMPLATE(_DEFAULT_MODEL),)
+_DEFAULT_REGIONS = ("us-east-1",)
+
+
+@lru_cache(maxsize=32)
+def _model_resource_arns(models: tuple[str, ...]) -> tuple[str, ...]:
+    """Expand model patterns to foundation-model ARNs (memoized).
+
+    Args:
+        models: Allowed model patterns
+
+    Returns:
+        tuple: Foundation-model resource ARNs
+    """
+    return tuple(map(_ARN_TEMPLATE, models))
 
 
 class IAMPolicyManager:
@@ -15,6 +37,21 @@ class IAMPolicyManager:
         >>> print(json.dumps(policy, indent=2))
     """
 
+    POLICY_VERSION = "2012-10-17"
+
+    MODEL_INVOCATION_ACTIONS = (
+        "bedrock:InvokeModel",
+        "bedrock:InvokeModelWithResponseStream",
+    )
+
+    # Static statement; copied per policy so callers can't mutate the template
+    INFERENCE_PROFILES_STATEMENT: ClassVar[dict[str, Any]] = {
+        "Sid": "BedrockInferenceProfiles",
+        "Effect": "Allow",
+        "Action": "bedrock:ListInferenceProfiles",
+        "Resource": "*",
+    }
+
     def generate_least_privilege_policy(
         self,
         regions: list[str] | None = None,
@@ -36,34 +73,27 @@ class IAMPolicyManager:
             ...     models=["anthropic.claude-*"],
             ... )
         """
+        resources = (
+            _DEFAULT_RESOURCES
+            if models is None
+            else _model_resource_arns(tuple(models))
+        )
         if regions is None:
-            regions = ["us-east-1"]
-
-        if models is None:
-            models = ["anthropic.claude-sonnet-4-*"]
+            regions = list(_DEFAULT_REGIONS)
 
         return {
-            "Version": "2012-10-17",
+            "Version": self.POLICY_VERSION,
             "Statement": [
                 {
                     "Sid": "BedrockModelInvocation",
                     "Effect": "Allow",
-                    "Action": [
-                        "bedrock:InvokeModel",
-                        "bedrock:InvokeModelWithResponseStream",
-                    ],
-                    "Resource": [
-                        f"arn:aws:bedrock:*::foundation-model/{model}"
-                        for model in models
-                    ],
-                    "Condition": {"StringEquals": {"aws:RequestedRegion": regions}},
-                },
-                {
-                    "Sid": "BedrockInferenceProfiles",
-                    "Effect": "Allow",
-                    "Action": "bedrock:ListInferenceProfiles",
-                    "Resource": "*",
+                    "Action": list(self.MODEL_INVOCATION_ACTIONS),
+                    "Resource": list(resources),
+                    "Condition": {
+                        "StringEquals": {"aws:RequestedRegion": list(regions)}
+                    },
                 },
+                dict(self.INFERENCE_PROFILES_STATEMENT),
             ],
         }
 
@@ -77,6 +107,9 @@ class IAMPolicyManager:
         Returns:
             str: JSON string
         """
+        if indent == 2:
+            return orjson.dumps(policy, option=orjson.OPT_INDENT_2).decode()
+        # orjson only supports 2-space indentation
         return json.dumps(policy, indent=indent)
 
     def save_to_file(self, policy: dict[str, Any], filepath: str) -> None:
@@ -86,5 +119,5 @@ class IAMPolicyManager:
             policy: IAM policy document
             filepath: Output file path
         """
-        with open(filepath, "w") as f:
-            json.dump(policy, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(policy, option=orjson.OPT_INDENT_2))
@@ -1,12 +1,18 @@
 """AWS Bedrock client with streaming and prompt caching."""
 
 import asyncio
-import json
+import io
+import random
+import threading
 import time
-from collections.abc import AsyncIterator
-from typing import Any
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from typing import Any, ClassVar
 
 import boto3
+import orjson
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from claude_bedrock_cursor.config import get_config
@@ -17,6 +23,212 @@ from claude_bedrock_cursor.utils.errors import (
     BedrockValidationError,
 )
 
+# Shared by every client: pooled keep-alive connections, a read timeout long
+# enough for slow streams, and botocore's adaptive (rate-limiting) retries.
+# invoke_streaming keeps its own throttling loop, so botocore only retries once.
+_BOTO_CONFIG = BotoConfig(
+    retries={"mode": "adaptive", "max_attempts": 2},
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=300,
+)
+
+
+@cache
+def _get_boto_client(service: str, region: str) -> Any:
+    """Get a boto3 client, created once per (service, region) per process.
+
+    boto3 clients are thread-safe, and building one (service model load,
+    endpoint resolution, credential chain) costs hundreds of milliseconds.
+    All clients come from boto3's default session, so ``~/.aws/config`` is
+    parsed once.
+
+    Args:
+        service: AWS service name (e.g. "bedrock-runtime")
+        region: AWS region
+
+    Returns:
+        botocore client for the service
+    """
+    return boto3.client(service, region_name=region, config=_BOTO_CONFIG)
+
+
+# Marks the end of a pumped event stream
+_STREAM_END = object()
+
+
+@dataclass(slots=True)
+class _StreamFailure:
+    """Exception raised while reading the event stream in the pump thread."""
+
+    error: Exception
+
+
+def _pump_events(
+    body: Iterable[dict[str, Any]],
+    queue: asyncio.Queue[Any],
+    loop: asyncio.AbstractEventLoop,
+    stop: threading.Event,
+) -> None:
+    """Feed a blocking event stream into an asyncio queue (runs in a thread).
+
+    Puts block while the queue is full, so a slow consumer throttles reads.
+
+    Args:
+        body: botocore event stream
+        queue: Queue drained by the consuming coroutine
+        loop: Event loop that owns the queue
+        stop: Set when the consumer stops reading
+    """
+
+    def put(item: Any) -> bool:
+        if stop.is_set():
+            return False
+        try:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        except Exception:
+            # Event loop closed or shutting down; nobody is listening
+            return False
+        return True
+
+    try:
+        for event in body:
+            if not put(event):
+                return
+    except Exception as e:
+        put(_StreamFailure(e))
+        return
+    put(_STREAM_END)
+
+
+def _with_cache_control(content: str | list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the last block of a message's content as a cache breakpoint.
+
+    Args:
+        content: Message content as a string or list of content blocks
+
+    Returns:
+        list: Content blocks with cache_control on the last one
+    """
+    if isinstance(content, str):
+        return [
+            {"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}
+        ]
+    blocks = list(content)
+    if blocks:
+        blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+    return blocks
+
+
+# Messages API version Bedrock expects in every Anthropic request body
+_ANTHROPIC_VERSION = "bedrock-2023-05-31"
+
+
+def _content_chars(content: str | list[dict[str, Any]]) -> int:
+    """Count the text characters in message content, without joining it.
+
+    Args:
+        content: Message content as a string or list of content blocks
+
+    Returns:
+        int: Number of text characters
+    """
+    if isinstance(content, str):
+        return len(content)
+    return sum(len(block.get("text", "")) for block in content)
+
+
+def _request_body(
+    prompt: str,
+    system_context: str | None,
+    max_output_tokens: int,
+    max_thinking_tokens: int,
+    enable_caching: bool,
+    tools: list[dict[str, Any]] | None = None,
+    rag_context: str | None = None,
+    history: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build an Anthropic messages request body for Bedrock.
+
+    See ``BedrockClient._build_request_body`` for the caching layout.
+
+    Args:
+        prompt: User prompt
+        system_context: System context to cache
+        max_output_tokens: Response token limit
+        max_thinking_tokens: Extended thinking budget (0 disables)
+        enable_caching: Whether to set cache breakpoints
+        tools: Tool definitions (Anthropic tool schema format)
+        rag_context: Retrieved/project context to cache after the system
+        history: Prior conversation turns preceding the prompt
+
+    Returns:
+        dict: Request body for Bedrock API
+    """
+    messages = [dict(message) for message in history or ()]
+    if messages and enable_caching:
+        messages[-1]["content"] = _with_cache_control(messages[-1]["content"])
+    messages.append({"role": "user", "content": prompt})
+
+    body: dict[str, Any] = {
+        "anthropic_version": _ANTHROPIC_VERSION,
+        "max_tokens": max_output_tokens,
+        "messages": messages,
+    }
+
+    # Add thinking tokens if configured
+    if max_thinking_tokens > 0:
+        body["max_thinking_tokens"] = max_thinking_tokens
+
+    if tools:
+        body["tools"] = [dict(tool) for tool in tools]
+        if enable_caching:
+            body["tools"][-1]["cache_control"] = {"type": "ephemeral"}
+
+    # Add system and retrieved context, cacheable when caching is enabled
+    system: list[dict[str, Any]] = [
+        {"type": "text", "text": text} for text in (system_context, rag_context) if text
+    ]
+    if system:
+        if enable_caching:
+            for block in system:
+                block["cache_control"] = {"type": "ephemeral"}  # CACHE!
+        body["system"] = system
+
+    return body
+
+
+@lru_cache(maxsize=64)
+def _serialize_simple_body(
+    prompt: str,
+    system_context: str | None,
+    max_output_tokens: int,
+    max_thinking_tokens: int,
+    enable_caching: bool,
+) -> bytes:
+    """JSON-encode a prompt-only request body (memoized).
+
+    Args:
+        prompt: User prompt
+        system_context: System context to cache
+        max_output_tokens: Response token limit
+        max_thinking_tokens: Extended thinking budget (0 disables)
+        enable_caching: Whether to set cache breakpoints
+
+    Returns:
+        bytes: JSON request body
+    """
+    return orjson.dumps(
+        _request_body(
+            prompt,
+            system_context,
+            max_output_tokens,
+            max_thinking_tokens,
+            enable_caching,
+        )
+    )
+
 
 class BedrockClient:
     """AWS Bedrock client with streaming and caching.
@@ -34,6 +246,52 @@ class BedrockClient:
         Hello! How can I help you today?
     """
 
+    # Only events containing this can carry text; others skip JSON parsing
+    TEXT_DELTA_MARKER = b'"content_block_delta"'
+
+    # message_start/message_delta events carry billed token usage
+    USAGE_MARKER = b'"usage"'
+
+    # Bedrock appends invocation metrics to the final (message_stop) event
+    INVOCATION_METRICS_KEY = "amazon-bedrock-invocationMetrics"
+    INVOCATION_METRICS_MARKER = b'"amazon-bedrock-invocationMetrics"'
+
+    # Stream events buffered between the reader thread and the consumer
+    STREAM_QUEUE_SIZE = 32
+
+    # Seconds without a new event before a partial text batch is flushed
+    STREAM_IDLE_FLUSH = 0.005
+
+    # Transient error codes retried with backoff: error raised once exhausted
+    RETRYABLE_ERRORS: ClassVar[dict[str, tuple[type[BedrockError], str]]] = {
+        "ThrottlingException": (
+            BedrockThrottlingError,
+            "Throttling error after {retries} retries",
+        ),
+        "ServiceUnavailableException": (
+            BedrockConnectionError,
+            "Bedrock unavailable after {retries} retries: {message}",
+        ),
+        "ModelStreamErrorException": (
+            BedrockError,
+            "Model stream error after {retries} retries: {message}",
+        ),
+        "InternalServerException": (
+            BedrockError,
+            "Bedrock internal error after {retries} retries: {message}",
+        ),
+    }
+
+    # Error codes that fail immediately; anything unlisted is a BedrockError
+    FATAL_ERRORS: ClassVar[dict[str, tuple[type[BedrockError], str]]] = {
+        "ValidationException": (BedrockValidationError, "Invalid request: {message}"),
+        "ResourceNotFoundException": (BedrockError, "Model not found: {model_id}"),
+    }
+
+    # Throttling backoff: full jitter over base * 2**attempt, capped (seconds)
+    BACKOFF_BASE = 0.5
+    BACKOFF_CAP = 20.0
+
     def __init__(
         self,
         region: str | None = None,
@@ -55,10 +313,7 @@ class BedrockClient:
 
         # Initialize boto3 client
         try:
-            self.client = boto3.client(
-                "bedrock-runtime",
-                region_name=self.region,
-            )
+            self.client = _get_boto_client("bedrock-runtime", self.region)
         except Exception as e:
             raise BedrockConnectionError(
                 f"Failed to initialize Bedrock client: {e}"
@@ -69,6 +324,12 @@ class BedrockClient:
         prompt: str,
         system_context: str | None = None,
         max_retries: int = 3,
+        batch_size: int = 0,
+        usage: dict[str, int] | None = None,
+        *,
+        tools: list[dict[str, Any]] | None = None,
+        rag_context: str | None = None,
+        history: list[dict[str, Any]] | None = None,
     ) -> AsyncIterator[str]:
         """Stream responses from Bedrock with automatic retry.
 
@@ -76,6 +337,14 @@ class BedrockClient:
             prompt: User prompt
             system_context: System context for caching (optional)
             max_retries: Maximum retry attempts on throttling
+            batch_size: Coalesce text deltas until this many characters are
+                buffered (0 yields every delta as it arrives)
+            usage: Dict filled with the token usage Bedrock bills for the
+                call (input_tokens, output_tokens,
+                cache_read_input_tokens, cache_creation_input_tokens)
+            tools: Tool definitions, cached as a prefix
+            rag_context: Retrieved context cached after the system context
+            history: Prior conversation turns preceding the prompt
 
         Yields:
             str: Response chunks
@@ -91,49 +360,51 @@ class BedrockClient:
             ... ):
             ...     print(chunk, end="")
         """
+        body = self._serialize_request_body(
+            prompt, system_context, tools, rag_context, history
+        )
+
         for attempt in range(max_retries):
+            yielded = False
             try:
-                # Build request body
-                body = self._build_request_body(prompt, system_context)
-
                 # Invoke model with streaming
                 response = await asyncio.to_thread(
                     self.client.invoke_model_with_response_stream,
                     modelId=self.model_id,
-                    body=json.dumps(body),
+                    body=body,
                 )
 
                 # Stream response chunks
-                async for chunk in self._stream_response(response):
+                async for chunk in self._stream_response(response, batch_size, usage):
+                    yielded = True
                     yield chunk
 
                 return  # Success - exit retry loop
 
             except ClientError as e:
                 error_code = e.response["Error"]["Code"]
+                message = e.response["Error"].get("Message", "")
 
-                if error_code == "ThrottlingException":
-                    if attempt < max_retries - 1:
-                        # Exponential backoff
-                        wait_time = 2**attempt
-                        await asyncio.sleep(wait_time)
+                retryable = self.RETRYABLE_ERRORS.get(error_code)
+                if retryable is not None:
+                    # Retrying after output was yielded would repeat it
+                    if attempt < max_retries - 1 and not yielded:
+                        await asyncio.sleep(self._backoff_delay(attempt))
                         continue
-                    raise BedrockThrottlingError(
-                        f"Throttling error after {max_retries} retries"
-                    ) from e
-
-                elif error_code == "ValidationException":
-                    raise BedrockValidationError(
-                        f"Invalid request: {e.response['Error']['Message']}"
-                    ) from e
-
-                elif error_code == "ResourceNotFoundException":
-                    raise BedrockError(f"Model not found: {self.model_id}") from e
-
+                    error_cls, template = retryable
                 else:
-                    raise BedrockError(
-                        f"Bedrock error: {e.response['Error']['Message']}"
-                    ) from e
+                    error_cls, template = self.FATAL_ERRORS.get(
+                        error_code, (BedrockError, "Bedrock error: {message}")
+                    )
+
+                raise error_cls(
+                    template.format(
+                        code=error_code,
+                        message=message,
+                        model_id=self.model_id,
+                        retries=max_retries,
+                    )
+                ) from e
 
             except Exception as e:
                 raise BedrockError(f"Unexpected error: {e}") from e
@@ -158,73 +429,247 @@ class BedrockClient:
             >>> print(response)
             '2 + 2 = 4'
         """
-        chunks = []
+        buffer = io.StringIO()
         async for chunk in self.invoke_streaming(prompt, system_context):
-            chunks.append(chunk)
-        return "".join(chunks)
+            buffer.write(chunk)
+        return buffer.getvalue()
 
     def _build_request_body(
         self,
         prompt: str,
         system_context: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        rag_context: str | None = None,
+        history: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Build Bedrock API request body with caching.
 
+        With caching enabled, up to four cache breakpoints are set, static
+        content first: the last tool definition, the system context, the
+        retrieved context, and the final message of the prior conversation.
+
         Args:
             prompt: User prompt
             system_context: System context to cache
+            tools: Tool definitions (Anthropic tool schema format)
+            rag_context: Retrieved/project context to cache after the system
+            history: Prior conversation turns preceding the prompt
 
         Returns:
             dict: Request body for Bedrock API
         """
-        body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": self.max_output_tokens,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-        }
+        return _request_body(
+            prompt,
+            system_context,
+            self.max_output_tokens,
+            self.max_thinking_tokens,
+            self.enable_caching,
+            tools,
+            rag_context,
+            history,
+        )
 
-        # Add thinking tokens if configured
-        if self.max_thinking_tokens > 0:
-            body["max_thinking_tokens"] = self.max_thinking_tokens
+    def _serialize_request_body(
+        self,
+        prompt: str,
+        system_context: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        rag_context: str | None = None,
+        history: list[dict[str, Any]] | None = None,
+    ) -> bytes:
+        """Build and JSON-encode the request body.
 
-        # Add cacheable system context
-        if system_context and self.enable_caching:
-            body["system"] = [
-                {
-                    "type": "text",
-                    "text": system_context,
-                    "cache_control": {"type": "ephemeral"},  # CACHE!
-                }
-            ]
+        Bodies without tools, retrieved context or history (health checks,
+        one-shot prompts) are memoized, since they are byte-identical for
+        the same prompt and settings.
 
-        return body
+        Args:
+            prompt: User prompt
+            system_context: System context to cache
+            tools: Tool definitions (Anthropic tool schema format)
+            rag_context: Retrieved/project context to cache after the system
+            history: Prior conversation turns preceding the prompt
+
+        Returns:
+            bytes: JSON request body
+        """
+        if tools or rag_context or history:
+            return orjson.dumps(
+                self._build_request_body(
+                    prompt, system_context, tools, rag_context, history
+                )
+            )
+        return _serialize_simple_body(
+            prompt,
+            system_context,
+            self.max_output_tokens,
+            self.max_thinking_tokens,
+            self.enable_caching,
+        )
 
-    async def _stream_response(self, response: dict[str, Any]) -> AsyncIterator[str]:
+    async def _stream_response(
+        self,
+        response: dict[str, Any],
+        batch_size: int = 0,
+        usage: dict[str, int] | None = None,
+    ) -> AsyncIterator[str]:
         """Stream and parse Bedrock response.
 
+        The botocore event stream does blocking socket reads, so it is
+        iterated in a worker thread and events are handed over through a
+        bounded queue, keeping the event loop free while waiting on Bedrock.
+
+        With ``batch_size`` set, deltas are joined into larger chunks; a
+        partial batch is flushed once the stream goes idle for
+        ``STREAM_IDLE_FLUSH`` seconds so the first token is not held back.
+
         Args:
             response: Bedrock streaming response
+            batch_size: Minimum characters per yielded chunk (0 disables)
+            usage: Dict updated with token usage reported in the stream
 
         Yields:
             str: Text chunks from response
         """
-        for event in response["body"]:
-            chunk_data = event.get("chunk")
-            if chunk_data:
-                chunk = json.loads(chunk_data["bytes"])
-
-                # Extract text from content_block_delta
-                if chunk.get("type") == "content_block_delta":
-                    delta = chunk.get("delta", {})
-                    if delta.get("type") == "text_delta":
-                        text = delta.get("text", "")
-                        if text:
-                            yield text
+        body = response["body"]
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        pump = asyncio.ensure_future(
+            asyncio.to_thread(_pump_events, body, queue, loop, stop)
+        )
+
+        buffer: list[str] = []
+        buffered = 0
+        finished = False
+        try:
+            while True:
+                if buffer:
+                    try:
+                        event = await asyncio.wait_for(
+                            queue.get(), self.STREAM_IDLE_FLUSH
+                        )
+                    except TimeoutError:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        buffered = 0
+                        continue
+                else:
+                    event = await queue.get()
+
+                if event is _STREAM_END:
+                    break
+                if isinstance(event, _StreamFailure):
+                    if buffer:
+                        yield "".join(buffer)
+                    raise event.error
+
+                text = self._event_text(event, usage)
+                if not text:
+                    continue
+                if batch_size <= 0:
+                    yield text
+                    continue
+
+                buffer.append(text)
+                buffered += len(text)
+                if buffered >= batch_size:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered = 0
+
+            if buffer:
+                yield "".join(buffer)
+            finished = True
+            await pump
+        finally:
+            if not finished:
+                # Consumer left early: stop the pump and unblock its last put
+                stop.set()
+                while not queue.empty():
+                    queue.get_nowait()
+                close = getattr(body, "close", None)
+                if close is not None:
+                    close()
+
+    def _event_text(
+        self, event: dict[str, Any], usage: dict[str, int] | None = None
+    ) -> str | None:
+        """Extract delta text from one stream event.
+
+        Args:
+            event: Raw event from the Bedrock event stream
+            usage: Dict to update from usage-bearing events (skipped if None)
+
+        Returns:
+            str: Text of a text_delta event, None for any other event
+        """
+        chunk_data = event.get("chunk")
+        if not chunk_data:
+            return None
+
+        # Skip ping/content_block_start etc. without parsing them
+        raw = chunk_data["bytes"]
+        if self.TEXT_DELTA_MARKER not in raw:
+            if usage is not None and (
+                self.USAGE_MARKER in raw or self.INVOCATION_METRICS_MARKER in raw
+            ):
+                self._record_usage(orjson.loads(raw), usage)
+            return None
+
+        chunk = orjson.loads(raw)
+
+        # Extract text from content_block_delta
+        if chunk.get("type") == "content_block_delta":
+            delta = chunk.get("delta", {})
+            if delta.get("type") == "text_delta":
+                return delta.get("text") or None
+        return None
+
+    def _record_usage(self, chunk: dict[str, Any], usage: dict[str, int]) -> None:
+        """Copy token counts from a usage-bearing stream event.
+
+        Handles message_start/message_delta usage blocks and the Bedrock
+        invocation metrics attached to the final event.
+
+        Args:
+            chunk: Parsed stream event
+            usage: Dict to update
+        """
+        invocation_metrics = chunk.get(self.INVOCATION_METRICS_KEY)
+        if invocation_metrics:
+            for source, key in (
+                ("inputTokenCount", "input_tokens"),
+                ("outputTokenCount", "output_tokens"),
+            ):
+                if isinstance(invocation_metrics.get(source), int):
+                    usage.setdefault(key, invocation_metrics[source])
+
+        if chunk.get("type") == "message_start":
+            reported = chunk.get("message", {}).get("usage", {})
+        elif chunk.get("type") == "message_delta":
+            reported = chunk.get("usage", {})
+        else:
+            return
+
+        for key, value in reported.items():
+            if isinstance(value, int):
+                usage[key] = value
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Pick a full-jitter exponential backoff delay.
+
+        Random delays keep concurrent clients that were throttled together
+        from retrying in lockstep.
+
+        Args:
+            attempt: Zero-based retry attempt
+
+        Returns:
+            float: Seconds to sleep before retrying
+        """
+        ceiling = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2**attempt)
+        return random.uniform(0, ceiling)  # nosec B311 - jitter, not crypto
 
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the current model.
@@ -249,6 +694,10 @@ class BedrockClient:
     async def validate_connection(self) -> bool:
         """Validate connection to Bedrock.
 
+        Checks the AWS credentials and region with sts:GetCallerIdentity,
+        which needs no IAM permission, costs no model tokens and takes one
+        round-trip instead of a full model invocation.
+
         Returns:
             bool: True if connection is valid
 
@@ -261,9 +710,9 @@ class BedrockClient:
             >>> print(f"Connection valid: {is_valid}")
         """
         try:
-            # Try a simple invocation
-            response = await self.invoke("Say 'test' and nothing else.")
-            return "test" in response.lower()
+            sts_client = _get_boto_client("sts", self.region)
+            await asyncio.to_thread(sts_client.get_caller_identity)
+            return True
 
         except Exception as e:
             raise BedrockConnectionError(f"Connection validation failed: {e}") from e
@@ -281,28 +730,71 @@ class BedrockClient:
             ...     print(model["modelId"])
         """
         try:
-            bedrock_client = boto3.client("bedrock", region_name=self.region)
+            return await self._list_models_in_region(self.region)
+        except Exception as e:
+            raise BedrockError(f"Failed to list models: {e}") from e
 
-            response = await asyncio.to_thread(
-                bedrock_client.list_foundation_models,
-                byProvider="Anthropic",
-            )
+    async def list_available_models_multi(
+        self, regions: list[str]
+    ) -> list[dict[str, Any]]:
+        """List Claude models across several regions concurrently.
+
+        Args:
+            regions: AWS regions to query
 
-            model_summaries = response.get("modelSummaries", [])
-            # Convert TypedDict to regular dict for compatibility
-            return [dict(model) for model in model_summaries]
+        Returns:
+            list: Available models, deduplicated by modelId (first region wins)
+
+        Raises:
+            BedrockError: If listing fails in any region
 
+        Example:
+            >>> client = BedrockClient()
+            >>> models = await client.list_available_models_multi(
+            ...     ["us-east-1", "us-west-2", "eu-central-1"]
+            ... )
+        """
+        try:
+            per_region = await asyncio.gather(
+                *(self._list_models_in_region(region) for region in regions)
+            )
         except Exception as e:
             raise BedrockError(f"Failed to list models: {e}") from e
 
+        models: dict[str, dict[str, Any]] = {}
+        for region_models in per_region:
+            for model in region_models:
+                models.setdefault(model.get("modelId", ""), model)
+        return list(models.values())
+
+    async def _list_models_in_region(self, region: str) -> list[dict[str, Any]]:
+        """List Anthropic foundation models in one region.
+
+        Args:
+            region: AWS region to query
+
+        Returns:
+            list: Model summaries
+        """
+        bedrock_client = _get_boto_client("bedrock", region)
+
+        response = await asyncio.to_thread(
+            bedrock_client.list_foundation_models,
+            byProvider="Anthropic",
+        )
+
+        model_summaries = response.get("modelSummaries", [])
+        # Convert TypedDict to regular dict for compatibility
+        return [dict(model) for model in model_summaries]
+
 
 class BedrockClientWithMetrics(BedrockClient):
     """Bedrock client with cost tracking metrics.
 
     Tracks:
-    - Input/output tokens
+    - Input/output tokens (as billed by Bedrock when reported)
     - Request count
-    - Cache hits
+    - Cache hits and cache read/write tokens
     - Latency
 
     Example:
@@ -312,45 +804,75 @@ class BedrockClientWithMetrics(BedrockClient):
         >>> print(f"Tokens used: {metrics['total_tokens']}")
     """
 
+    # Average characters per Claude token, for streams that report no usage
+    CHARS_PER_TOKEN = 4
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize client with metrics tracking."""
         super().__init__(*args, **kwargs)
-        self._metrics = {
-            "request_count": 0,
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cache_hits": 0,
-            "total_latency": 0.0,
-        }
+        self._metrics = self._empty_metrics()
+        self._metrics_lock = threading.Lock()
 
     async def invoke_streaming(
         self,
         prompt: str,
         system_context: str | None = None,
         max_retries: int = 3,
+        batch_size: int = 0,
+        usage: dict[str, int] | None = None,
+        *,
+        tools: list[dict[str, Any]] | None = None,
+        rag_context: str | None = None,
+        history: list[dict[str, Any]] | None = None,
     ) -> AsyncIterator[str]:
-        """Stream with metrics tracking."""
-        start_time = time.time()
+        """Stream with metrics tracking.
 
-        # Rough token estimation (actual tokens from API metadata)
-        input_tokens = len(prompt.split()) + (
-            len(system_context.split()) if system_context else 0
-        )
-        output_tokens = 0
+        Token counts come from the usage Bedrock reports in the stream; a
+        character-based estimate is used only when the stream carries none.
+        """
+        start_time = time.time()
+        usage = {} if usage is None else usage
+        output_chars = 0
 
-        chunks = []
         async for chunk in super().invoke_streaming(
-            prompt, system_context, max_retries
+            prompt,
+            system_context,
+            max_retries,
+            batch_size,
+            usage,
+            tools=tools,
+            rag_context=rag_context,
+            history=history,
         ):
-            chunks.append(chunk)
+            output_chars += len(chunk)
             yield chunk
 
-        # Update metrics
-        output_tokens = len("".join(chunks).split())
-        self._metrics["request_count"] += 1
-        self._metrics["input_tokens"] += input_tokens
-        self._metrics["output_tokens"] += output_tokens
-        self._metrics["total_latency"] += time.time() - start_time
+        if "input_tokens" not in usage:
+            input_chars = (
+                len(prompt)
+                + len(system_context or "")
+                + len(rag_context or "")
+                + sum(map(_content_chars, (m["content"] for m in history or ())))
+            )
+            usage["input_tokens"] = self._estimate_tokens(input_chars)
+        if "output_tokens" not in usage:
+            usage["output_tokens"] = self._estimate_tokens(output_chars)
+
+        # Update metrics in one critical section so concurrent streams
+        # (gathered tasks or threads) never interleave their counters
+        cache_read = usage.get("cache_read_input_tokens", 0)
+        latency = time.time() - start_time
+        with self._metrics_lock:
+            self._metrics["request_count"] += 1
+            self._metrics["input_tokens"] += usage["input_tokens"]
+            self._metrics["output_tokens"] += usage["output_tokens"]
+            self._metrics["cache_read_tokens"] += cache_read
+            self._metrics["cache_write_tokens"] += usage.get(
+                "cache_creation_input_tokens", 0
+            )
+            if cache_read:
+                self._metrics["cache_hits"] += 1
+            self._metrics["total_latency"] += latency
 
     def get_metrics(self) -> dict[str, Any]:
         """Get current metrics.
@@ -363,23 +885,47 @@ class BedrockClientWithMetrics(BedrockClient):
             >>> metrics = client.get_metrics()
             >>> print(f"Requests: {metrics['request_count']}")
         """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
         return {
-            **self._metrics,
-            "total_tokens": self._metrics["input_tokens"]
-            + self._metrics["output_tokens"],
+            **metrics,
+            "total_tokens": metrics["input_tokens"] + metrics["output_tokens"],
             "avg_latency": (
-                self._metrics["total_latency"] / self._metrics["request_count"]
-                if self._metrics["request_count"] > 0
+                metrics["total_latency"] / metrics["request_count"]
+                if metrics["request_count"] > 0
                 else 0
             ),
         }
 
+    def _estimate_tokens(self, chars: int) -> int:
+        """Estimate a token count from a character count.
+
+        Args:
+            chars: Number of characters
+
+        Returns:
+            int: Estimated tokens (rounded up)
+        """
+        return -(-chars // self.CHARS_PER_TOKEN)
+
     def reset_metrics(self) -> None:
         """Reset all metrics."""
-        self._metrics = {
+        with self._metrics_lock:
+            self._metrics = self._empty_metrics()
+
+    @staticmethod
+    def _empty_metrics() -> dict[str, Any]:
+        """Build a zeroed metrics dict.
+
+        Returns:
+            dict: Metrics with all counters at zero
+        """
+        return {
             "request_count": 0,
             "input_tokens": 0,
             "output_tokens": 0,
             "cache_hits": 0,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
             "total_latency": 0.0,
         }
@@ -1,16 +1,19 @@
 """CLI application using Typer framework."""
 
 import asyncio
+import sys
+from collections.abc import Coroutine
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from claude_bedrock_cursor import __version__
-from claude_bedrock_cursor.auth import OAuthManager
-from claude_bedrock_cursor.bedrock import BedrockClient
-from claude_bedrock_cursor.config import Config, get_config
+
+# Config (pydantic), Bedrock (boto3), OAuth (httpx, keyring) and rich.table
+# are imported inside the commands that use them, keeping `version`, `--help`
+# and completion fast
 
 # Create Typer app
 app = typer.Typer(
@@ -22,6 +25,32 @@ app = typer.Typer(
 # Rich console for beautiful output
 console = Console()
 
+# Characters of model output per console write when streaming
+STREAM_BATCH_SIZE = 256
+
+
+def _run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on its own event loop.
+
+    Loop-bound OAuth state (the shared HTTP client) is released before the
+    loop closes, so nothing is left to clean up at interpreter shutdown.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner() as runner:
+        try:
+            return runner.run(coro)
+        finally:
+            # The shared client can only exist if the OAuth module was imported
+            oauth = sys.modules.get("claude_bedrock_cursor.auth.oauth")
+            if oauth is not None:
+                runner.run(oauth.close_shared_client())
+
+
 # Default options
 CONFIG_FILE_OPTION = typer.Option(
     None,
@@ -81,6 +110,11 @@ def status() -> None:
     Example:
         $ claude-bedrock status
     """
+    from rich.table import Table
+
+    from claude_bedrock_cursor.auth import OAuthManager
+    from claude_bedrock_cursor.config import get_config
+
     console.print("[bold]📊 Claude Bedrock Status[/bold]\n")
 
     config = get_config()
@@ -94,9 +128,7 @@ def status() -> None:
     # Check authentication
     oauth = OAuthManager()
     auth_status = (
-        "✓ Authenticated"
-        if asyncio.run(oauth.is_authenticated())
-        else "✗ Not authenticated"
+        "✓ Authenticated" if _run(oauth.is_authenticated()) else "✗ Not authenticated"
     )
     table.add_row("Authentication", auth_status, "")
 
@@ -124,6 +156,8 @@ def configure(
         $ claude-bedrock configure
         $ claude-bedrock configure --config config.toml
     """
+    from claude_bedrock_cursor.config import Config, get_config
+
     console.print("[bold]⚙️  Configuration[/bold]\n")
 
     if config_file:
@@ -138,9 +172,13 @@ def configure(
         config = get_config()
 
     # Display current configuration
+    # Read fields directly (no model_dump copy) and render in one print call
     console.print("\n[bold]Current Configuration:[/bold]")
-    for key, value in config.to_dict().items():
-        console.print(f"  {key}: {value}")
+    console.print(
+        "\n".join(
+            f"  {name}: {getattr(config, name)}" for name in type(config).model_fields
+        )
+    )
 
 
 @app.command()
@@ -154,6 +192,26 @@ def version() -> None:
 
 
 # Authentication commands
+# The auth command bodies are module-level coroutines so callers already on
+# an event loop (tests, scripts) can await them without Click dispatch
+async def _auth_login() -> None:
+    """Run the OAuth login flow and store the tokens.
+
+    Raises:
+        typer.Exit: If login fails
+    """
+    from claude_bedrock_cursor.auth import OAuthManager
+
+    oauth = OAuthManager()
+    try:
+        await oauth.login()
+        console.print("[green]✓[/green] Login successful!")
+        console.print("\nTokens stored securely in system keyring.")
+    except Exception as e:
+        console.print(f"[red]✗[/red] Login failed: {e}")
+        raise typer.Exit(1) from e
+
+
 @auth_app.command("login")
 def auth_login() -> None:
     """Login with Claude Code MAX subscription.
@@ -163,18 +221,20 @@ def auth_login() -> None:
     """
     console.print("[bold]🔐 OAuth Login[/bold]\n")
     console.print("This will open Claude Code to generate an OAuth token.\n")
+    _run(_auth_login())
 
-    async def login() -> None:
-        oauth = OAuthManager()
-        try:
-            await oauth.login()
-            console.print("[green]✓[/green] Login successful!")
-            console.print("\nTokens stored securely in system keyring.")
-        except Exception as e:
-            console.print(f"[red]✗[/red] Login failed: {e}")
-            raise typer.Exit(1) from e
 
-    asyncio.run(login())
+async def _auth_logout() -> None:
+    """Clear stored tokens and wait for server-side revocation."""
+    from claude_bedrock_cursor.auth import OAuthManager
+
+    oauth = OAuthManager()
+    await oauth.logout()
+    console.print("[green]✓[/green] Logged out successfully")
+    console.print("All tokens cleared from keyring")
+
+    # Let the background server-side revocation finish before exiting
+    await oauth.drain()
 
 
 @auth_app.command("logout")
@@ -185,14 +245,24 @@ def auth_logout() -> None:
         $ claude-bedrock auth logout
     """
     console.print("[bold]🔐 Logout[/bold]\n")
+    _run(_auth_logout())
 
-    async def logout() -> None:
-        oauth = OAuthManager()
-        await oauth.logout()
-        console.print("[green]✓[/green] Logged out successfully")
-        console.print("All tokens cleared from keyring")
 
-    asyncio.run(logout())
+async def _auth_refresh() -> None:
+    """Exchange the stored refresh token for a new token pair.
+
+    Raises:
+        typer.Exit: If the refresh fails
+    """
+    from claude_bedrock_cursor.auth import OAuthManager
+
+    oauth = OAuthManager()
+    try:
+        await oauth.refresh_access_token()
+        console.print("[green]✓[/green] Token refreshed successfully")
+    except Exception as e:
+        console.print(f"[red]✗[/red] Refresh failed: {e}")
+        raise typer.Exit(1) from e
 
 
 @auth_app.command("refresh")
@@ -203,17 +273,27 @@ def auth_refresh() -> None:
         $ claude-bedrock auth refresh
     """
     console.print("[bold]🔄 Refreshing Token[/bold]\n")
+    _run(_auth_refresh())
 
-    async def refresh() -> None:
-        oauth = OAuthManager()
-        try:
-            await oauth.refresh_access_token()
-            console.print("[green]✓[/green] Token refreshed successfully")
-        except Exception as e:
-            console.print(f"[red]✗[/red] Refresh failed: {e}")
-            raise typer.Exit(1) from e
 
-    asyncio.run(refresh())
+async def _auth_status() -> bool:
+    """Report whether tokens are stored.
+
+    Returns:
+        bool: True if authenticated
+    """
+    from claude_bedrock_cursor.auth import OAuthManager
+
+    oauth = OAuthManager()
+    is_auth = await oauth.is_authenticated()
+
+    if is_auth:
+        console.print("[green]✓[/green] Authenticated")
+        console.print("Tokens stored in system keyring")
+    else:
+        console.print("[red]✗[/red] Not authenticated")
+        console.print("\nRun: claude-bedrock auth login")
+    return is_auth
 
 
 @auth_app.command("status")
@@ -223,19 +303,7 @@ def auth_status() -> None:
     Example:
         $ claude-bedrock auth status
     """
-
-    async def check_status() -> None:
-        oauth = OAuthManager()
-        is_auth = await oauth.is_authenticated()
-
-        if is_auth:
-            console.print("[green]✓[/green] Authenticated")
-            console.print("Tokens stored in system keyring")
-        else:
-            console.print("[red]✗[/red] Not authenticated")
-            console.print("\nRun: claude-bedrock auth login")
-
-    asyncio.run(check_status())
+    _run(_auth_status())
 
 
 # AWS commands
@@ -261,6 +329,8 @@ def aws_validate() -> None:
     Example:
         $ claude-bedrock aws validate
     """
+    from claude_bedrock_cursor.bedrock import BedrockClient
+
     console.print("[bold]✓ Validating Bedrock Access[/bold]\n")
 
     async def validate() -> None:
@@ -280,7 +350,7 @@ def aws_validate() -> None:
             console.print(f"[red]✗[/red] Validation failed: {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(validate())
+    _run(validate())
 
 
 # Models commands
@@ -291,6 +361,10 @@ def models_list() -> None:
     Example:
         $ claude-bedrock models list
     """
+    from rich.table import Table
+
+    from claude_bedrock_cursor.bedrock import BedrockClient
+
     console.print("[bold]📋 Available Models[/bold]\n")
 
     async def list_models() -> None:
@@ -314,7 +388,7 @@ def models_list() -> None:
             console.print(f"[red]✗[/red] Failed to list models: {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(list_models())
+    _run(list_models())
 
 
 @models_app.command("test")
@@ -332,6 +406,8 @@ def models_test(
         $ claude-bedrock models test
         $ claude-bedrock models test --prompt "What is 2+2?"
     """
+    from claude_bedrock_cursor.bedrock import BedrockClient
+
     console.print("[bold]🧪 Testing Model[/bold]\n")
     console.print(f"Prompt: {prompt}\n")
 
@@ -340,7 +416,10 @@ def models_test(
             client = BedrockClient()
 
             console.print("[yellow]Streaming response:[/yellow]\n")
-            async for chunk in client.invoke_streaming(prompt):
+            # Batch deltas so each console write carries more than a word
+            async for chunk in client.invoke_streaming(
+                prompt, batch_size=STREAM_BATCH_SIZE
+            ):
                 console.print(chunk, end="")
 
             console.print("\n\n[green]✓[/green] Test successful")
@@ -349,7 +428,7 @@ def models_test(
             console.print(f"\n[red]✗[/red] Test failed: {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(test_model())
+    _run(test_model())
 
 
 # Cursor commands
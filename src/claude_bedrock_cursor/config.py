@@ -1,6 +1,10 @@
 """Configuration management with Pydantic validation."""
 
+import json
+from collections.abc import Mapping
+from functools import cache, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Literal
 
 try:
@@ -9,7 +13,32 @@ except ImportError:
     import tomli as tomllib  # type: ignore[import-not-found,no-redef]  # Fallback for Python 3.10
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+# AWS region partitions accepted by validate_aws_region (str.startswith tuple)
+_AWS_REGION_PREFIXES = ("us-", "eu-", "ap-", "sa-", "ca-", "me-", "af-")
+
+# Validator error messages (%-templates, formatted only on failure)
+_INVALID_REGION_FMT = "Invalid AWS region: %s"
+_MISSING_CURSOR_PATH_FMT = "Cursor path does not exist: %s"
+
+# Parsed os.environ overlay shared by every Config(); cleared by reload_env()
+_env_vars: Mapping[str, str | None] | None = None
+
+
+class _CachedEnvSettingsSource(EnvSettingsSource):
+    """Environment source that parses ``os.environ`` once per process."""
+
+    def _load_env_vars(self) -> Mapping[str, str | None]:
+        global _env_vars
+        if _env_vars is None:
+            _env_vars = MappingProxyType(dict(super()._load_env_vars()))
+        return _env_vars
 
 
 class Config(BaseSettings):
@@ -41,6 +70,7 @@ class Config(BaseSettings):
 
         >>> # Override with environment variables
         >>> os.environ["AWS_REGION"] = "us-west-2"
+        >>> reload_env()  # environment is snapshotted on first use
         >>> config = Config()
         >>> print(config.aws_region)
         'us-west-2'
@@ -51,6 +81,12 @@ class Config(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Config is loaded once and passed around as-is: never re-validate
+        # (or copy) an existing instance, and keep attribute writes cheap
+        revalidate_instances="never",
+        validate_assignment=False,
+        # Build the validation schema on first use, not at import time
+        defer_build=True,
     )
 
     # AWS Bedrock Configuration
@@ -126,6 +162,34 @@ class Config(BaseSettings):
         description="Monthly budget limit in USD",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Swap the environment source for one that reuses a parsed snapshot.
+
+        Args:
+            settings_cls: The settings class
+            init_settings: Init kwargs source
+            env_settings: Default environment source (replaced)
+            dotenv_settings: ``.env`` file source
+            file_secret_settings: Secrets directory source
+
+        Returns:
+            tuple: Sources in priority order
+        """
+        return (
+            init_settings,
+            _CachedEnvSettingsSource(settings_cls),
+            dotenv_settings,
+            file_secret_settings,
+        )
+
     @field_validator("cursor_path")
     @classmethod
     def validate_cursor_path(cls, v: Path | None) -> Path | None:
@@ -141,7 +205,7 @@ class Config(BaseSettings):
             ValueError: If path doesn't exist
         """
         if v is not None and not v.exists():
-            raise ValueError(f"Cursor path does not exist: {v}")
+            raise ValueError(_MISSING_CURSOR_PATH_FMT % v)
         return v
 
     @field_validator("aws_region")
@@ -158,15 +222,17 @@ class Config(BaseSettings):
         Raises:
             ValueError: If region format is invalid
         """
-        valid_prefixes = ["us-", "eu-", "ap-", "sa-", "ca-", "me-", "af-"]
-        if not any(v.startswith(prefix) for prefix in valid_prefixes):
-            raise ValueError(f"Invalid AWS region: {v}")
+        if not v.startswith(_AWS_REGION_PREFIXES):
+            raise ValueError(_INVALID_REGION_FMT % v)
         return v
 
     @classmethod
     def from_toml(cls, path: Path) -> "Config":
         """Load configuration from TOML file.
 
+        Parsed files are cached by path and modification time; each call
+        returns an unvalidated shallow copy of the cached instance.
+
         Args:
             path: Path to TOML file
 
@@ -182,13 +248,12 @@ class Config(BaseSettings):
             >>> print(config.aws_region)
             'us-east-1'
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {path}")
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}") from None
 
-        with open(path, "rb") as f:
-            data = tomllib.load(f)
-
-        return cls(**data)
+        return _load_toml(cls, path.resolve(), mtime_ns).model_copy()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary.
@@ -202,7 +267,29 @@ class Config(BaseSettings):
             >>> print(config_dict["aws_region"])
             'us-east-1'
         """
-        return self.model_dump()
+        # Every field is a scalar, Path or None, so a shallow copy of the
+        # instance dict equals model_dump() without the serializer walk
+        return dict(self.__dict__)
+
+    def write_toml(self, path: Path) -> None:
+        """Write configuration to a TOML file readable by from_toml.
+
+        Fields set to None are omitted.
+
+        Args:
+            path: Destination TOML file
+
+        Example:
+            >>> Config(aws_region="eu-west-1").write_toml(Path("config.toml"))
+            >>> print(Config.from_toml(Path("config.toml")).aws_region)
+            'eu-west-1'
+        """
+        lines = [
+            f"{name} = {_toml_value(value)}"
+            for name, value in self.__dict__.items()
+            if value is not None
+        ]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
     def to_env_vars(self) -> dict[str, str]:
         """Convert config to environment variables.
@@ -216,20 +303,45 @@ class Config(BaseSettings):
             >>> print(env_vars["AWS_REGION"])
             'us-east-1'
         """
+        fields = self.__dict__
         return {
-            key.upper(): str(value)
-            for key, value in self.to_dict().items()
-            if value is not None
+            env_name: str(value)
+            for name, env_name in _ENV_VAR_NAMES.items()
+            if (value := fields[name]) is not None
         }
 
 
-# Global configuration instance
+def _toml_value(value: Any) -> str:
+    """Render a scalar config value as a TOML literal.
+
+    Args:
+        value: bool, int, float, str or Path
+
+    Returns:
+        str: TOML representation
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return repr(value)
+    # JSON string escapes are valid TOML basic-string escapes
+    return json.dumps(str(value))
+
+
+# Field name -> environment variable name, computed once for to_env_vars()
+_ENV_VAR_NAMES = {name: name.upper() for name in Config.model_fields}
+
+# Process-wide override installed by set_config(); None means "use the
+# environment-built default"
 _config: Config | None = None
 
 
 def get_config() -> Config:
     """Get global configuration instance.
 
+    Returns the set_config() override if there is one, otherwise a default
+    built once from the environment and cached.
+
     Returns:
         Config: Global configuration
 
@@ -238,15 +350,27 @@ def get_config() -> Config:
         >>> print(config.aws_region)
         'us-east-1'
     """
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    config = _config
+    return config if config is not None else _default_config()
+
+
+@cache
+def _default_config() -> Config:
+    """Build the environment-based default configuration (cached).
+
+    Returns:
+        Config: Configuration from environment and ``.env``
+    """
+    return Config()
 
 
 def set_config(config: Config) -> None:
     """Set global configuration instance.
 
+    The override is process-wide: every thread, event loop and task sees it,
+    including ones started before the call. A single attribute assignment
+    is atomic, so no locking is needed.
+
     Args:
         config: Configuration to set
 
@@ -258,3 +382,33 @@ def set_config(config: Config) -> None:
     """
     global _config
     _config = config
+
+
+@lru_cache(maxsize=16)
+def _load_toml(cls: type[Config], path: Path, mtime_ns: int) -> Config:
+    """Parse and validate a TOML config file (cached by Config.from_toml).
+
+    Args:
+        cls: Config class to build
+        path: Resolved path to TOML file
+        mtime_ns: File modification time, part of the cache key only
+
+    Returns:
+        Config: Validated configuration
+    """
+    return cls(**tomllib.loads(path.read_bytes().decode()))
+
+
+def reload_env() -> None:
+    """Re-read environment variables on the next Config() construction.
+
+    Example:
+        >>> os.environ["AWS_REGION"] = "eu-west-1"
+        >>> reload_env()
+        >>> print(get_config().aws_region)
+        'eu-west-1'
+    """
+    global _env_vars
+    _env_vars = None
+    _load_toml.cache_clear()
+    _default_config.cache_clear()
@@ -4,64 +4,64 @@
 class ClaudeBedrockError(Exception):
     """Base exception for all claude-bedrock-cursor errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigError(ClaudeBedrockError):
     """Configuration-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(ClaudeBedrockError):
     """Authentication-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class NotAuthenticatedError(AuthenticationError):
     """User is not authenticated."""
 
-    pass
+    __slots__ = ()
 
 
 class TokenRefreshError(AuthenticationError):
     """Failed to refresh access token."""
 
-    pass
+    __slots__ = ()
 
 
 class BedrockError(ClaudeBedrockError):
     """AWS Bedrock-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class BedrockConnectionError(BedrockError):
     """Failed to connect to AWS Bedrock."""
 
-    pass
+    __slots__ = ()
 
 
 class BedrockThrottlingError(BedrockError):
     """AWS Bedrock throttling error."""
 
-    pass
+    __slots__ = ()
 
 
 class BedrockValidationError(BedrockError):
     """Invalid request to AWS Bedrock."""
 
-    pass
+    __slots__ = ()
 
 
 class CursorIntegrationError(ClaudeBedrockError):
     """Cursor IDE integration errors."""
 
-    pass
+    __slots__ = ()
 
 
 class IAMPolicyError(ClaudeBedrockError):
     """IAM policy-related errors."""
 
-    pass
+    __slots__ = ()
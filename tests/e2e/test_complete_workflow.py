@@ -1,15 +1,25 @@
 """End-to-end tests for complete workflows."""
 
-from datetime import UTC
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
 from typer.testing import CliRunner
 
 from claude_bedrock_cursor.auth.oauth import OAuthManager
-from claude_bedrock_cursor.bedrock.client import BedrockClient
-from claude_bedrock_cursor.cli import app
+from claude_bedrock_cursor.bedrock.client import BedrockClient, BedrockClientWithMetrics
+from claude_bedrock_cursor.cli import (
+    _auth_login,
+    _auth_logout,
+    _auth_refresh,
+    _auth_status,
+    app,
+)
 from claude_bedrock_cursor.config import Config
 
 runner = CliRunner()
@@ -19,15 +29,15 @@ runner = CliRunner()
 class TestCompleteSetupWorkflow:
     """End-to-end tests for initial setup workflow."""
 
-    @pytest.mark.asyncio
     async def test_fresh_install_to_first_query(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
         mock_keyring: dict[str, str],
         mock_subprocess_run: MagicMock,
-        mock_httpx_client: AsyncMock,
-        mock_boto3_client: MagicMock,
+        mock_oauth_http: httpx.AsyncClient,
+        mock_boto3_client: Any,
+        fake_invoke: tuple[str, ...],
+        make_client: Callable[..., BedrockClient],
+        isolated_home: Path,
     ):
         """Test complete workflow from fresh install to first query.
 
@@ -38,27 +48,25 @@ class TestCompleteSetupWorkflow:
         4. Make first Bedrock query
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
             mock_keyring: Mocked keyring fixture
             mock_subprocess_run: Mocked subprocess fixture
-            mock_httpx_client: Mocked httpx client fixture
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_oauth_http: Mock-transport OAuth client fixture
+            mock_boto3_client: Fake Bedrock client fixture
+            fake_invoke: Canned invoke_streaming fixture
+            make_client: BedrockClient factory fixture
+            isolated_home: Isolated home directory fixture
         """
-        monkeypatch.setenv("HOME", str(tmp_path))
-
         # Step 1: Initialize configuration
         result = runner.invoke(app, ["init", "--region", "us-east-1"])
         assert result.exit_code == 0
         assert "initialized" in result.stdout.lower()
 
         # Verify config file created
-        config_file = tmp_path / ".claude-bedrock" / "config.toml"
+        config_file = isolated_home / ".claude-bedrock" / "config.toml"
         assert config_file.exists()
 
         # Step 2: Login with OAuth
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            result = runner.invoke(app, ["auth", "login"])
+        result = runner.invoke(app, ["auth", "login"])
 
         assert result.exit_code == 0
 
@@ -71,26 +79,18 @@ class TestCompleteSetupWorkflow:
         assert result.exit_code == 0
 
         # Step 4: Make first Bedrock query
-        config = Config.from_toml(config_file)
-        client = BedrockClient(config=config)
+        client = make_client()
 
-        chunks = []
-        async for chunk in client.invoke_streaming("Hello, Claude!"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in client.invoke_streaming("Hello, Claude!")]
 
         assert len(chunks) > 0
 
-    def test_initialization_with_custom_config(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ):
+    def test_initialization_with_custom_config(self, isolated_home: Path):
         """Test initialization with custom configuration.
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
+            isolated_home: Isolated home directory fixture
         """
-        monkeypatch.setenv("HOME", str(tmp_path))
-
         # Initialize with custom settings
         result = runner.invoke(
             app,
@@ -106,7 +106,7 @@ class TestCompleteSetupWorkflow:
         assert result.exit_code == 0
 
         # Verify custom config
-        config_file = tmp_path / ".claude-bedrock" / "config.toml"
+        config_file = isolated_home / ".claude-bedrock" / "config.toml"
         config = Config.from_toml(config_file)
 
         assert config.aws_region == "eu-west-1"
@@ -117,14 +117,12 @@ class TestCompleteSetupWorkflow:
 class TestAuthenticationWorkflow:
     """End-to-end tests for authentication workflows."""
 
-    @pytest.mark.asyncio
     async def test_login_refresh_logout_cycle(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
         mock_keyring: dict[str, str],
         mock_subprocess_run: MagicMock,
-        mock_httpx_client: AsyncMock,
+        mock_oauth_http: httpx.AsyncClient,
+        make_config: Callable[..., Config],
     ):
         """Test complete authentication cycle.
 
@@ -137,76 +135,53 @@ class TestAuthenticationWorkflow:
         6. Check status (not authenticated)
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
             mock_keyring: Mocked keyring fixture
             mock_subprocess_run: Mocked subprocess fixture
-            mock_httpx_client: Mocked httpx client fixture
+            mock_oauth_http: Mock-transport OAuth client fixture
+            make_config: Config file factory fixture
         """
-        monkeypatch.setenv("HOME", str(tmp_path))
-
         # Initialize first
-        runner.invoke(app, ["init"])
+        make_config()
+        mock_subprocess_run.return_value.stdout = b"Your OAuth token: oauth_abc\n"
 
+        # Command bodies are awaited directly; test_cli.py covers the
+        # argv parsing of each auth command
         # Step 1: Login
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            result = runner.invoke(app, ["auth", "login"])
-
-        assert result.exit_code == 0
+        await _auth_login()
 
         # Step 2: Check authenticated
-        result = runner.invoke(app, ["auth", "status"])
-        assert result.exit_code == 0
-        assert "authenticated" in result.stdout.lower()
+        assert await _auth_status()
 
         # Step 3: Refresh token
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "refreshed_access",
-            "refresh_token": "refreshed_refresh",
-            "expires_in": 300,
-        }
-
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            result = runner.invoke(app, ["auth", "refresh"])
-
-        assert result.exit_code == 0
+        await _auth_refresh()
 
         # Step 4: Still authenticated
-        result = runner.invoke(app, ["auth", "status"])
-        assert result.exit_code == 0
+        assert await _auth_status()
 
         # Step 5: Logout
-        result = runner.invoke(app, ["auth", "logout"])
-        assert result.exit_code == 0
+        await _auth_logout()
 
         # Step 6: Not authenticated anymore
-        result = runner.invoke(app, ["auth", "status"])
-        assert result.exit_code == 0
-        assert "not authenticated" in result.stdout.lower()
+        assert not await _auth_status()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "refresh_token_in_keyring", ["valid_refresh"], indirect=True
+    )
     async def test_automatic_token_refresh_on_expiry(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
         mock_keyring: dict[str, str],
-        mock_httpx_client: AsyncMock,
+        mock_oauth_http: httpx.AsyncClient,
+        refresh_token_in_keyring: str,
     ):
         """Test automatic token refresh when making requests.
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
             mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
+            mock_oauth_http: Mock-transport OAuth client fixture
+            refresh_token_in_keyring: Stored refresh token fixture
         """
-        from datetime import datetime, timedelta
-
-        monkeypatch.setenv("HOME", str(tmp_path))
-
         # Setup expired token
         mock_keyring["claude-bedrock-cursor:access_token"] = "expired_token"
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "valid_refresh"
 
         # Set expiry to past
         past_timestamp = int((datetime.now(UTC) - timedelta(minutes=5)).timestamp())
@@ -214,18 +189,10 @@ class TestAuthenticationWorkflow:
             past_timestamp
         )
 
-        # Setup auto-refresh
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "new_access_token",
-            "refresh_token": "new_refresh_token",
-            "expires_in": 300,
-        }
-
         manager = OAuthManager()
 
-        # Should auto-refresh
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            token = await manager.get_valid_access_token()
+        # Should auto-refresh through the mock transport
+        token = await manager.get_valid_access_token()
 
         assert token == "new_access_token"
 
@@ -234,107 +201,75 @@ class TestAuthenticationWorkflow:
 class TestBedrockQueryWorkflow:
     """End-to-end tests for Bedrock query workflows."""
 
-    @pytest.mark.asyncio
     async def test_simple_query_workflow(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-        mock_boto3_client: MagicMock,
-        sample_config: Config,
+        bedrock_client: BedrockClient,
+        fake_invoke: tuple[str, ...],
     ):
         """Test simple query workflow.
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
-            mock_boto3_client: Mocked boto3 client fixture
-            sample_config: Sample config fixture
+            bedrock_client: Bedrock client fixture
+            fake_invoke: Canned invoke_streaming fixture
         """
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        client = BedrockClient(config=sample_config)
-
         # Make query
-        response = []
-        async for chunk in client.invoke_streaming("What is Python?"):
-            response.append(chunk)
+        response = [
+            chunk async for chunk in bedrock_client.invoke_streaming("What is Python?")
+        ]
 
         # Verify got response
         assert len(response) > 0
         full_response = "".join(response)
         assert isinstance(full_response, str)
 
-    @pytest.mark.asyncio
     async def test_query_with_prompt_caching(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-        mock_boto3_client: MagicMock,
+        mock_boto3_client: Any,
+        make_client: Callable[..., BedrockClient],
     ):
         """Test query workflow with prompt caching enabled.
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
+            make_client: BedrockClient factory fixture
         """
-        monkeypatch.setenv("HOME", str(tmp_path))
-
         # Initialize with caching enabled
-        runner.invoke(app, ["init"])
-
-        config_file = tmp_path / ".claude-bedrock" / "config.toml"
-        config = Config.from_toml(config_file)
-        config.enable_prompt_caching = True
-
-        client = BedrockClient(config=config)
+        client = make_client(enable_prompt_caching=True)
 
         system_context = "You are a helpful Python programming assistant."
 
         # First query (establishes cache)
-        response1 = []
-        async for chunk in client.invoke_streaming(
-            "Explain decorators", system_context=system_context
-        ):
-            response1.append(chunk)
+        response1 = [
+            chunk
+            async for chunk in client.invoke_streaming(
+                "Explain decorators", system_context=system_context
+            )
+        ]
 
         # Second query (uses cache)
-        response2 = []
-        async for chunk in client.invoke_streaming(
-            "Explain generators", system_context=system_context
-        ):
-            response2.append(chunk)
+        response2 = [
+            chunk
+            async for chunk in client.invoke_streaming(
+                "Explain generators", system_context=system_context
+            )
+        ]
 
         # Both should succeed
         assert len(response1) > 0
         assert len(response2) > 0
 
-    @pytest.mark.asyncio
     async def test_multiple_concurrent_queries(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-        mock_boto3_client: MagicMock,
-        sample_config: Config,
+        bedrock_client: BedrockClient,
     ):
         """Test handling multiple concurrent queries.
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
-            mock_boto3_client: Mocked boto3 client fixture
-            sample_config: Sample config fixture
+            bedrock_client: Bedrock client fixture
         """
-        import asyncio
-
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        client = BedrockClient(config=sample_config)
 
         async def make_query(prompt: str):
-            chunks = []
-            async for chunk in client.invoke_streaming(prompt):
-                chunks.append(chunk)
+            chunks = [chunk async for chunk in bedrock_client.invoke_streaming(prompt)]
             return "".join(chunks)
 
         # Make 5 concurrent queries
@@ -347,163 +282,57 @@ class TestBedrockQueryWorkflow:
 
 
 @pytest.mark.e2e
-class TestErrorRecoveryWorkflow:
-    """End-to-end tests for error recovery workflows."""
-
-    @pytest.mark.asyncio
-    async def test_recovery_from_throttling(
-        self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-        mock_boto3_client: MagicMock,
-        sample_config: Config,
-    ):
-        """Test automatic recovery from throttling errors.
-
-        Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
-            mock_boto3_client: Mocked boto3 client fixture
-            sample_config: Sample config fixture
-        """
-        from botocore.exceptions import ClientError
-
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        # Simulate throttling on first call, success on retry
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise ClientError(
-                    error_response={"Error": {"Code": "ThrottlingException"}},
-                    operation_name="InvokeModel",
-                )
-            return mock_boto3_client.invoke_model_with_response_stream.return_value
-
-        mock_boto3_client.invoke_model_with_response_stream.side_effect = side_effect
-
-        client = BedrockClient(config=sample_config)
-
-        # Should succeed after retry
-        chunks = []
-        async for chunk in client.invoke_streaming("test query"):
-            chunks.append(chunk)
-
-        assert len(chunks) > 0
-        assert call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_recovery_from_token_expiry(
-        self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-        mock_keyring: dict[str, str],
-        mock_httpx_client: AsyncMock,
-        mock_boto3_client: MagicMock,
-    ):
-        """Test automatic recovery from expired tokens.
-
-        Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
-            mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
-            mock_boto3_client: Mocked boto3 client fixture
-        """
-        from datetime import datetime, timedelta
-
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        # Setup expired token
-        mock_keyring["claude-bedrock-cursor:access_token"] = "expired_token"
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "valid_refresh"
-
-        past_timestamp = int((datetime.now(UTC) - timedelta(minutes=5)).timestamp())
-        mock_keyring["claude-bedrock-cursor:access_token_expires_at"] = str(
-            past_timestamp
-        )
-
-        # Setup auto-refresh
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "new_access_token",
-            "refresh_token": "new_refresh_token",
-            "expires_in": 300,
-        }
-
-        manager = OAuthManager()
-
-        # Should auto-refresh and succeed
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            token = await manager.get_valid_access_token()
-
-        assert token == "new_access_token"
-
-
-@pytest.mark.e2e
-@pytest.mark.slow
 class TestProductionScenarios:
     """End-to-end tests for production scenarios."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("n", [3, pytest.param(20, marks=pytest.mark.slow)])
     async def test_long_running_session(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-        mock_boto3_client: MagicMock,
-        sample_config: Config,
+        n: int,
+        bedrock_client: BedrockClient,
+        fake_invoke: tuple[str, ...],
     ):
         """Test long-running session with multiple queries.
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
-            mock_boto3_client: Mocked boto3 client fixture
-            sample_config: Sample config fixture
+            n: Number of queries in the session
+            bedrock_client: Bedrock client fixture
+            fake_invoke: Canned invoke_streaming fixture
         """
-        monkeypatch.setenv("HOME", str(tmp_path))
 
-        client = BedrockClient(config=sample_config)
+        async def query(i: int) -> list[str]:
+            return [
+                chunk async for chunk in bedrock_client.invoke_streaming(f"Query {i}")
+            ]
 
-        # Simulate 20 queries in a session
-        for i in range(20):
-            chunks = []
-            async for chunk in client.invoke_streaming(f"Query {i}"):
-                chunks.append(chunk)
+        # Simulate n queries in a session, issued concurrently
+        responses = await asyncio.gather(*(query(i) for i in range(n)))
 
-            assert len(chunks) > 0
+        assert all(len(chunks) > 0 for chunks in responses)
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("n", [3, pytest.param(10, marks=pytest.mark.slow)])
     async def test_metrics_tracking_across_session(
         self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-        mock_boto3_client: MagicMock,
-        sample_config: Config,
+        n: int,
+        make_client: Callable[..., BedrockClient],
     ):
         """Test metrics tracking across multiple queries.
 
         Args:
-            tmp_path: Pytest temporary directory
-            monkeypatch: Pytest monkeypatch fixture
-            mock_boto3_client: Mocked boto3 client fixture
-            sample_config: Sample config fixture
+            n: Number of queries in the session
+            make_client: BedrockClient factory fixture
         """
-        from claude_bedrock_cursor.bedrock.client import BedrockClientWithMetrics
-
-        monkeypatch.setenv("HOME", str(tmp_path))
+        client = make_client(BedrockClientWithMetrics)
 
-        client = BedrockClientWithMetrics(config=sample_config)
-
-        # Make 10 queries
-        for i in range(10):
+        # Make n queries
+        for i in range(n):
             async for _ in client.invoke_streaming(f"Query {i}"):
                 pass
 
         # Verify metrics
         metrics = client.get_metrics()
-        assert metrics["total_requests"] == 10
-        assert metrics["successful_requests"] == 10
-        assert metrics["failed_requests"] == 0
+        assert metrics["request_count"] == n
+        assert metrics["output_tokens"] > 0
+        assert metrics["total_tokens"] == (
+            metrics["input_tokens"] + metrics["output_tokens"]
+        )
@@ -1,11 +1,17 @@
 """Integration tests for OAuth authentication flow."""
 
+import asyncio
+import itertools
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
+from claude_bedrock_cursor.auth import oauth
 from claude_bedrock_cursor.auth.oauth import OAuthManager, TokenPair
+from claude_bedrock_cursor.auth.storage import SecureTokenStorage
 from claude_bedrock_cursor.utils.errors import (
     AuthenticationError,
     NotAuthenticatedError,
@@ -13,79 +19,93 @@ from claude_bedrock_cursor.utils.errors import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_oauth_manager(
+    oauth_manager: OAuthManager,
+    mock_oauth_http: httpx.AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Give the class-scoped manager this test's HTTP mock and fresh storage.
+
+    The manager's token cache is dropped along with the storage it mirrors.
+
+    Args:
+        oauth_manager: Class-scoped OAuth manager fixture
+        mock_oauth_http: Mock-transport OAuth client fixture
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(oauth_manager, "client", mock_oauth_http)
+    # New storage drops both cached tokens and remembered keyring misses
+    monkeypatch.setattr(oauth_manager, "storage", SecureTokenStorage())
+    monkeypatch.setattr(oauth_manager, "_token_cache", None)
+
+
 @pytest.mark.integration
 class TestOAuthFlowIntegration:
     """Integration tests for complete OAuth flow."""
 
-    @pytest.mark.asyncio
     async def test_complete_login_flow(
         self,
+        oauth_manager: OAuthManager,
         mock_keyring: dict[str, str],
         mock_subprocess_run: MagicMock,
-        mock_httpx_client: AsyncMock,
     ):
         """Test complete login flow from CLI to token storage.
 
         Args:
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
             mock_subprocess_run: Mocked subprocess fixture
-            mock_httpx_client: Mocked httpx client fixture
         """
-        manager = OAuthManager()
-
         # Step 1: Run login
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            pair = await manager.login()
+        pair = await oauth_manager.login()
 
         # Verify tokens received
-        assert pair.access_token == "test_access_token"
-        assert pair.refresh_token == "test_refresh_token"
+        assert pair.access_token == "new_access_token"
+        assert pair.refresh_token == "new_refresh_token"
         assert not pair.is_expired()
 
         # Verify tokens stored in keyring
-        assert mock_keyring["claude-bedrock-cursor:access_token"] == "test_access_token"
+        assert mock_keyring["claude-bedrock-cursor:access_token"] == "new_access_token"
         assert (
-            mock_keyring["claude-bedrock-cursor:refresh_token"] == "test_refresh_token"
+            mock_keyring["claude-bedrock-cursor:refresh_token"] == "new_refresh_token"
         )
 
         # Verify authentication status
-        assert manager.is_authenticated()
+        assert await oauth_manager.is_authenticated()
 
-    @pytest.mark.asyncio
     async def test_login_to_refresh_flow(
         self,
+        oauth_manager: OAuthManager,
         mock_keyring: dict[str, str],
         mock_subprocess_run: MagicMock,
-        mock_httpx_client: AsyncMock,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
     ):
         """Test login followed by token refresh.
 
         Args:
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
             mock_subprocess_run: Mocked subprocess fixture
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token response factory fixture
         """
-        manager = OAuthManager()
-
         # Step 1: Login
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            login_pair = await manager.login()
+        login_pair = await oauth_manager.login()
 
         initial_refresh_token = login_pair.refresh_token
 
         # Step 2: Simulate token expiry and refresh
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "refreshed_access_token",
-            "refresh_token": "new_refresh_token",  # Rotated!
-            "expires_in": 300,
-        }
+        oauth_token_endpoint.return_value = token_response(
+            "refreshed_access_token", "rotated_refresh_token"
+        )
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            refresh_pair = await manager.refresh_access_token()
+        refresh_pair = await oauth_manager.refresh_access_token()
 
         # Verify new tokens
         assert refresh_pair.access_token == "refreshed_access_token"
-        assert refresh_pair.refresh_token == "new_refresh_token"
+        assert refresh_pair.refresh_token == "rotated_refresh_token"
 
         # Verify refresh token was rotated
         assert refresh_pair.refresh_token != initial_refresh_token
@@ -96,90 +116,91 @@ class TestOAuthFlowIntegration:
             == "refreshed_access_token"
         )
         assert (
-            mock_keyring["claude-bedrock-cursor:refresh_token"] == "new_refresh_token"
+            mock_keyring["claude-bedrock-cursor:refresh_token"]
+            == "rotated_refresh_token"
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("refresh_token_in_keyring", ["refresh_v1"], indirect=True)
     async def test_multiple_refresh_cycles(
-        self, mock_keyring: dict[str, str], mock_httpx_client: AsyncMock
+        self,
+        oauth_manager: OAuthManager,
+        refresh_token_in_keyring: str,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
     ):
         """Test multiple refresh token rotation cycles.
 
         Args:
-            mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_manager: Shared OAuth manager fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token response factory fixture
         """
-        manager = OAuthManager()
+        # Each token request answers with the next version
+        versions = itertools.count(2)
 
-        # Initial refresh token
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "refresh_v1"
+        def next_token_response(request: httpx.Request) -> httpx.Response:
+            i = next(versions)
+            return token_response(f"access_v{i}", f"refresh_v{i}")
 
-        refresh_tokens = ["refresh_v1"]
+        oauth_token_endpoint.side_effect = next_token_response
 
-        # Perform 5 refresh cycles
-        for i in range(2, 7):
-            mock_httpx_client.post.return_value.json.return_value = {
-                "access_token": f"access_v{i}",
-                "refresh_token": f"refresh_v{i}",
-                "expires_in": 300,
-            }
-
-            with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-                pair = await manager.refresh_access_token()
-
-            refresh_tokens.append(pair.refresh_token)
+        # Perform 5 refresh cycles; each one spends the token the previous
+        # one issued, so they run in order (concurrent refreshes coalesce)
+        refresh_tokens = ["refresh_v1"] + [
+            (await oauth_manager.refresh_access_token()).refresh_token for _ in range(5)
+        ]
 
         # Verify all refresh tokens were different (rotation occurred)
         assert len(set(refresh_tokens)) == 6
         assert refresh_tokens == [f"refresh_v{i}" for i in range(1, 7)]
 
-    @pytest.mark.asyncio
     async def test_logout_clears_all_tokens(
         self,
+        oauth_manager: OAuthManager,
         mock_keyring: dict[str, str],
         mock_subprocess_run: MagicMock,
-        mock_httpx_client: AsyncMock,
     ):
         """Test logout clears all authentication data.
 
         Args:
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
             mock_subprocess_run: Mocked subprocess fixture
-            mock_httpx_client: Mocked httpx client fixture
         """
-        manager = OAuthManager()
-
         # Login first
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            await manager.login()
+        await oauth_manager.login()
 
         # Verify authenticated
-        assert manager.is_authenticated()
+        assert await oauth_manager.is_authenticated()
         assert len(mock_keyring) > 0
 
         # Logout
-        await manager.logout()
+        await oauth_manager.logout()
 
         # Verify cleared
-        assert not manager.is_authenticated()
+        assert not await oauth_manager.is_authenticated()
         assert "claude-bedrock-cursor:access_token" not in mock_keyring
         assert "claude-bedrock-cursor:refresh_token" not in mock_keyring
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "refresh_token_in_keyring", ["valid_refresh"], indirect=True
+    )
     async def test_auto_refresh_on_expiry(
-        self, mock_keyring: dict[str, str], mock_httpx_client: AsyncMock
+        self,
+        oauth_manager: OAuthManager,
+        mock_keyring: dict[str, str],
+        refresh_token_in_keyring: str,
     ):
         """Test automatic token refresh when expired.
 
         Args:
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
+            refresh_token_in_keyring: Stored refresh token fixture
         """
-        manager = OAuthManager()
-
         # Setup expired access token
         mock_keyring["claude-bedrock-cursor:access_token"] = "expired_token"
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "valid_refresh"
 
         # Set expiry to past
         past_timestamp = int((datetime.now(UTC) - timedelta(minutes=5)).timestamp())
@@ -187,16 +208,8 @@ class TestOAuthFlowIntegration:
             past_timestamp
         )
 
-        # Setup refresh response
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "new_access_token",
-            "refresh_token": "new_refresh_token",
-            "expires_in": 300,
-        }
-
         # Get valid token (should auto-refresh)
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            token = await manager.get_valid_access_token()
+        token = await oauth_manager.get_valid_access_token()
 
         # Verify got refreshed token
         assert token == "new_access_token"
@@ -207,13 +220,16 @@ class TestOAuthFlowIntegration:
 class TestOAuthErrorScenarios:
     """Integration tests for OAuth error scenarios."""
 
-    @pytest.mark.asyncio
     async def test_cli_command_failure(
-        self, mock_keyring: dict[str, str], mock_subprocess_run: MagicMock
+        self,
+        oauth_manager: OAuthManager,
+        mock_keyring: dict[str, str],
+        mock_subprocess_run: MagicMock,
     ):
         """Test handling of Claude CLI command failure.
 
         Args:
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
             mock_subprocess_run: Mocked subprocess fixture
         """
@@ -221,115 +237,92 @@ class TestOAuthErrorScenarios:
         mock_subprocess_run.return_value.returncode = 1
         mock_subprocess_run.return_value.stderr = "Claude CLI not found"
 
-        manager = OAuthManager()
-
         with pytest.raises(AuthenticationError, match="Failed to get OAuth token"):
-            await manager._get_oauth_token_from_claude_cli()
+            await oauth_manager._get_oauth_token_from_claude_cli()
 
-    @pytest.mark.asyncio
     async def test_oauth_exchange_failure(
-        self, mock_keyring: dict[str, str], mock_httpx_client: AsyncMock
+        self,
+        oauth_manager: OAuthManager,
+        mock_keyring: dict[str, str],
+        oauth_token_endpoint: MagicMock,
     ):
         """Test handling of OAuth token exchange failure.
 
         Args:
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
         """
         # Simulate invalid OAuth token
-        mock_httpx_client.post.return_value.status_code = 401
-        mock_httpx_client.post.return_value.json.return_value = {
-            "error": "invalid_grant"
-        }
-
-        manager = OAuthManager()
+        oauth_token_endpoint.return_value = httpx.Response(
+            401, json={"error": "invalid_grant"}
+        )
 
-        with (
-            patch("httpx.AsyncClient", return_value=mock_httpx_client),
-            pytest.raises(AuthenticationError, match="Failed to exchange OAuth token"),
-        ):
-            await manager._exchange_oauth_token("invalid_token")
+        with pytest.raises(AuthenticationError, match="Failed to exchange OAuth token"):
+            await oauth_manager._exchange_oauth_token("invalid_token")
 
-    @pytest.mark.asyncio
-    async def test_refresh_without_login(self, mock_keyring: dict[str, str]):
+    async def test_refresh_without_login(
+        self, oauth_manager: OAuthManager, mock_keyring: dict[str, str]
+    ):
         """Test refresh fails when not logged in.
 
         Args:
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
         """
-        manager = OAuthManager()
-
         with pytest.raises(NotAuthenticatedError, match="No refresh token found"):
-            await manager.refresh_access_token()
+            await oauth_manager.refresh_access_token()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "refresh_token_in_keyring", ["invalid_refresh"], indirect=True
+    )
     async def test_refresh_with_invalid_token(
-        self, mock_keyring: dict[str, str], mock_httpx_client: AsyncMock
+        self,
+        oauth_manager: OAuthManager,
+        refresh_token_in_keyring: str,
+        oauth_token_endpoint: MagicMock,
     ):
         """Test refresh fails with invalid refresh token.
 
         Args:
-            mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_manager: Shared OAuth manager fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
         """
-        # Setup invalid refresh token
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "invalid_refresh"
-
         # Simulate refresh failure
-        mock_httpx_client.post.return_value.status_code = 401
-        mock_httpx_client.post.return_value.json.return_value = {
-            "error": "invalid_token"
-        }
-
-        manager = OAuthManager()
+        oauth_token_endpoint.return_value = httpx.Response(
+            401, json={"error": "invalid_token"}
+        )
 
-        with (
-            patch("httpx.AsyncClient", return_value=mock_httpx_client),
-            pytest.raises(TokenRefreshError, match="Failed to refresh access token"),
-        ):
-            await manager.refresh_access_token()
+        with pytest.raises(TokenRefreshError, match="Failed to refresh access token"):
+            await oauth_manager.refresh_access_token()
 
-    @pytest.mark.asyncio
     async def test_concurrent_refresh_requests(
-        self, mock_keyring: dict[str, str], mock_httpx_client: AsyncMock
+        self,
+        oauth_manager: OAuthManager,
+        refresh_token_in_keyring: str,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
     ):
         """Test handling of concurrent refresh requests.
 
         Args:
-            mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_manager: Shared OAuth manager fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token response factory fixture
         """
-        import asyncio
-
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "test_refresh"
-
-        call_count = 0
-
-        def increment_call_count(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            return AsyncMock(
-                status_code=200,
-                json=AsyncMock(
-                    return_value={
-                        "access_token": f"access_{call_count}",
-                        "refresh_token": f"refresh_{call_count}",
-                        "expires_in": 300,
-                    }
-                ),
-            )
-
-        mock_httpx_client.post.side_effect = increment_call_count
-
-        manager = OAuthManager()
+        # One response per possible token request
+        oauth_token_endpoint.side_effect = [
+            token_response(f"access_{i}", f"refresh_{i}") for i in range(1, 4)
+        ]
 
         # Make concurrent refresh requests
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            results = await asyncio.gather(
-                manager.refresh_access_token(),
-                manager.refresh_access_token(),
-                manager.refresh_access_token(),
-            )
+        results = await asyncio.gather(
+            oauth_manager.refresh_access_token(),
+            oauth_manager.refresh_access_token(),
+            oauth_manager.refresh_access_token(),
+        )
 
         # All should succeed
         assert len(results) == 3
@@ -340,67 +333,57 @@ class TestOAuthErrorScenarios:
 class TestOAuthSecurity:
     """Integration tests for OAuth security features."""
 
-    @pytest.mark.asyncio
-    async def test_token_rotation_prevents_reuse(
-        self, mock_keyring: dict[str, str], mock_httpx_client: AsyncMock
+    @pytest.mark.parametrize(
+        ("refresh_token", "expires_in"),
+        [
+            pytest.param("refresh_v2", 300, id="rotation"),
+            pytest.param("new_refresh", 600, id="expiry"),
+        ],
+    )
+    async def test_refresh_stores_rotated_tokens(
+        self,
+        refresh_token: str,
+        expires_in: int,
+        oauth_manager: OAuthManager,
+        mock_keyring: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
     ):
-        """Test that old refresh tokens cannot be reused.
+        """Test a refresh replaces the old refresh token and tracks expiry.
+
+        Old refresh tokens must not be reusable, and the stored expiry must
+        be exactly ``expires_in`` seconds from the refresh.
 
         Args:
+            refresh_token: Rotated refresh token the endpoint returns
+            expires_in: Access token lifetime the endpoint returns
+            oauth_manager: Shared OAuth manager fixture
             mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
+            monkeypatch: Pytest monkeypatch fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token response factory fixture
         """
-        manager = OAuthManager()
-
-        # Initial refresh token
         old_refresh_token = "refresh_v1"
         mock_keyring["claude-bedrock-cursor:refresh_token"] = old_refresh_token
 
-        # First refresh - gets new tokens
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "access_v2",
-            "refresh_token": "refresh_v2",
-            "expires_in": 300,
-        }
+        # Freeze the clock the manager reads, so expiry is exact
+        now = 1_704_067_200  # 2024-01-01T00:00:00Z
+        monkeypatch.setattr(oauth.time, "time", lambda: now)
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            await manager.refresh_access_token()
-
-        # Verify old token replaced
-        assert mock_keyring["claude-bedrock-cursor:refresh_token"] == "refresh_v2"
-        assert mock_keyring["claude-bedrock-cursor:refresh_token"] != old_refresh_token
-
-    @pytest.mark.asyncio
-    async def test_token_expiry_tracking(
-        self, mock_keyring: dict[str, str], mock_httpx_client: AsyncMock
-    ):
-        """Test token expiry timestamps are tracked correctly.
-
-        Args:
-            mock_keyring: Mocked keyring fixture
-            mock_httpx_client: Mocked httpx client fixture
-        """
-        manager = OAuthManager()
-
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "test_refresh"
-
-        # Refresh with specific expires_in
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "new_access",
-            "refresh_token": "new_refresh",
-            "expires_in": 600,  # 10 minutes
-        }
-
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            pair = await manager.refresh_access_token()
+        oauth_token_endpoint.return_value = token_response(
+            "new_access", refresh_token, expires_in
+        )
 
-        # Verify expiry is approximately 10 minutes from now
-        expected = datetime.now(UTC) + timedelta(seconds=600)
-        diff = abs((pair.expires_at - expected).total_seconds())
+        await oauth_manager.refresh_access_token()
 
-        assert diff < 5  # Allow 5 seconds tolerance
+        # Old token replaced, expiry stored as an absolute timestamp
+        assert mock_keyring["claude-bedrock-cursor:refresh_token"] == refresh_token
+        assert mock_keyring["claude-bedrock-cursor:refresh_token"] != old_refresh_token
+        assert mock_keyring["claude-bedrock-cursor:access_token_expires_at"] == str(
+            now + expires_in
+        )
 
-    @pytest.mark.asyncio
     async def test_secure_storage_isolation(self, mock_keyring: dict[str, str]):
         """Test tokens are isolated in secure storage.
 
@@ -1,8 +1,13 @@
 """Unit tests for AWS Bedrock client."""
 
+import asyncio
+import itertools
 import json
-from unittest.mock import MagicMock
+from collections.abc import Callable, Mapping
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call
 
+import orjson
 import pytest
 from botocore.exceptions import ClientError
 
@@ -17,39 +22,88 @@ from claude_bedrock_cursor.utils.errors import (
     BedrockValidationError,
 )
 
+# Bedrock errors shared by the error-handling tests; botocore formats the
+# message on construction, so each is built once
+_THROTTLING_ERROR = ClientError(
+    error_response={"Error": {"Code": "ThrottlingException"}},
+    operation_name="InvokeModel",
+)
+_VALIDATION_ERROR = ClientError(
+    error_response={
+        "Error": {"Code": "ValidationException", "Message": "Invalid model parameters"}
+    },
+    operation_name="InvokeModel",
+)
+_INTERNAL_ERROR = ClientError(
+    error_response={
+        "Error": {"Code": "InternalServerError", "Message": "Internal server error"}
+    },
+    operation_name="InvokeModel",
+)
+
+# Stream event reporting output token usage
+_USAGE_EVENT = {
+    "chunk": {"bytes": b'{"type":"message_delta","usage":{"output_tokens":10}}'}
+}
+
 
 @pytest.mark.unit
 class TestBedrockClient:
     """Test suite for BedrockClient class."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            pytest.param(None, ["Hello", " World"], id="hello-world"),
+            pytest.param((), [], id="empty"),
+        ],
+    )
     async def test_invoke_streaming_basic(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self,
+        body: tuple[dict[str, Any], ...] | None,
+        expected: list[str],
+        mock_boto3_client: Any,
+        sample_config: Config,
     ):
-        """Test basic streaming invocation.
+        """Test streaming invocation parses each stream into text chunks.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            body: Stream events to serve, or None for the fixture's default
+            expected: Text chunks the stream should yield
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
+        if body is not None:
+            mock_boto3_client.stream = body
+
         client = BedrockClient()
 
-        chunks = []
-        async for chunk in client.invoke_streaming("test prompt"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in client.invoke_streaming("test prompt")]
 
-        assert len(chunks) == 2
-        assert chunks[0] == "Hello"
-        assert chunks[1] == " World"
+        assert chunks == expected
+
+    async def test_invoke_streaming_repeated_calls(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test each call on the mocked client streams the full response.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        client = BedrockClient()
+
+        for _ in range(2):
+            chunks = [chunk async for chunk in client.invoke_streaming("test")]
+            assert chunks == ["Hello", " World"]
 
-    @pytest.mark.asyncio
     async def test_invoke_streaming_with_system_context(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self, mock_boto3_client: Any, sample_config: Config
     ):
         """Test streaming with system context and caching.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
         client = BedrockClient()
@@ -60,32 +114,33 @@ class TestBedrockClient:
         ):
             chunks.append(chunk)
 
-        # Verify request includes system with cache_control
-        call_args = mock_boto3_client.invoke_model_with_response_stream.call_args
-        body = json.loads(call_args.kwargs["body"])
+        # The exact bytes sent are the serialized request body
+        request = mock_boto3_client.calls[-1]
+        body = client._build_request_body(
+            "test prompt", system_context="system instructions"
+        )
+        assert request["body"] == orjson.dumps(body)
 
+        # Verify request includes system with cache_control
         assert "system" in body
         assert len(body["system"]) == 1
         assert body["system"][0]["type"] == "text"
         assert body["system"][0]["text"] == "system instructions"
         assert body["system"][0]["cache_control"] == {"type": "ephemeral"}
 
-    @pytest.mark.asyncio
     async def test_invoke_streaming_without_caching(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self,
+        mock_boto3_client: Any,
+        make_client: Callable[..., BedrockClient],
     ):
         """Test streaming without prompt caching.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
-            sample_config: Sample config fixture
+            mock_boto3_client: Fake Bedrock client fixture
+            make_client: BedrockClient factory fixture
         """
-        # Disable caching
-        sample_config.enable_prompt_caching = False
-        from claude_bedrock_cursor.config import set_config
-
-        set_config(sample_config)
-        client = BedrockClient()
+        # Disable caching for this test only
+        client = make_client(enable_prompt_caching=False)
 
         chunks = []
         async for chunk in client.invoke_streaming(
@@ -93,39 +148,25 @@ class TestBedrockClient:
         ):
             chunks.append(chunk)
 
-        # Verify no system context added when caching disabled
-        call_args = mock_boto3_client.invoke_model_with_response_stream.call_args
-        body = json.loads(call_args.kwargs["body"])
-
-        # When caching is disabled, system context should not be included
-        assert "system" not in body
+        # Verify system context is sent without cache breakpoints
+        request = mock_boto3_client.calls[-1]
+        body = client._build_request_body(
+            "test prompt", system_context="system instructions"
+        )
+        assert request["body"] == orjson.dumps(body)
+        assert body["system"] == [{"type": "text", "text": "system instructions"}]
 
-    @pytest.mark.asyncio
     async def test_invoke_streaming_throttling_retry(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self, mock_boto3_client: Any, sample_config: Config
     ):
         """Test retry logic for throttling errors.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
         # First call raises throttling error, second succeeds
-        throttle_error = ClientError(
-            error_response={"Error": {"Code": "ThrottlingException"}},
-            operation_name="InvokeModel",
-        )
-
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise throttle_error
-            return mock_boto3_client.invoke_model_with_response_stream.return_value
-
-        mock_boto3_client.invoke_model_with_response_stream.side_effect = side_effect
+        mock_boto3_client.errors = iter([_THROTTLING_ERROR])
 
         client = BedrockClient()
 
@@ -135,24 +176,85 @@ class TestBedrockClient:
 
         # Should succeed after retry
         assert len(chunks) == 2
-        assert call_count == 2
+        assert len(mock_boto3_client.calls) == 2
+
+    async def test_invoke_streaming_service_unavailable_retry(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test ServiceUnavailableException is retried like throttling.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        mock_boto3_client.errors = iter(
+            [
+                ClientError(
+                    error_response={
+                        "Error": {
+                            "Code": "ServiceUnavailableException",
+                            "Message": "Try again",
+                        }
+                    },
+                    operation_name="InvokeModelWithResponseStream",
+                )
+            ]
+        )
+
+        client = BedrockClient()
+        chunks = [chunk async for chunk in client.invoke_streaming("test prompt")]
+
+        assert chunks == ["Hello", " World"]
+        assert len(mock_boto3_client.calls) == 2
+
+    async def test_invoke_streaming_no_retry_after_output(
+        self,
+        mock_boto3_client: Any,
+        sample_config: Config,
+        bedrock_stream_events: Mapping[str, dict[str, Any]],
+    ):
+        """Test a stream error after text was yielded is not retried.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+            bedrock_stream_events: Pre-encoded stream events fixture
+        """
+
+        def failing_body():
+            yield bedrock_stream_events["hello"]
+            raise ClientError(
+                error_response={
+                    "Error": {
+                        "Code": "ModelStreamErrorException",
+                        "Message": "stream broke",
+                    }
+                },
+                operation_name="InvokeModelWithResponseStream",
+            )
+
+        mock_boto3_client.stream = failing_body()
+
+        client = BedrockClient()
+        chunks = []
+        with pytest.raises(BedrockError, match="stream broke"):
+            async for chunk in client.invoke_streaming("test prompt"):
+                chunks.append(chunk)
+
+        assert chunks == ["Hello"]
+        assert len(mock_boto3_client.calls) == 1
 
-    @pytest.mark.asyncio
     async def test_invoke_streaming_max_retries_exceeded(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self, mock_boto3_client: Any, sample_config: Config
     ):
         """Test that max retries limit is enforced.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
         # Always raise throttling error
-        throttle_error = ClientError(
-            error_response={"Error": {"Code": "ThrottlingException"}},
-            operation_name="InvokeModel",
-        )
-        mock_boto3_client.invoke_model_with_response_stream.side_effect = throttle_error
+        mock_boto3_client.errors = itertools.repeat(_THROTTLING_ERROR)
 
         client = BedrockClient()
 
@@ -162,28 +264,16 @@ class TestBedrockClient:
             async for _ in client.invoke_streaming("test prompt", max_retries=2):
                 pass
 
-    @pytest.mark.asyncio
     async def test_invoke_streaming_validation_error(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self, mock_boto3_client: Any, sample_config: Config
     ):
         """Test handling of validation errors.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
-        validation_error = ClientError(
-            error_response={
-                "Error": {
-                    "Code": "ValidationException",
-                    "Message": "Invalid model parameters",
-                }
-            },
-            operation_name="InvokeModel",
-        )
-        mock_boto3_client.invoke_model_with_response_stream.side_effect = (
-            validation_error
-        )
+        mock_boto3_client.errors = itertools.repeat(_VALIDATION_ERROR)
 
         client = BedrockClient()
 
@@ -191,26 +281,16 @@ class TestBedrockClient:
             async for _ in client.invoke_streaming("test prompt"):
                 pass
 
-    @pytest.mark.asyncio
     async def test_invoke_streaming_generic_error(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self, mock_boto3_client: Any, sample_config: Config
     ):
         """Test handling of generic AWS errors.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
-        generic_error = ClientError(
-            error_response={
-                "Error": {
-                    "Code": "InternalServerError",
-                    "Message": "Internal server error",
-                }
-            },
-            operation_name="InvokeModel",
-        )
-        mock_boto3_client.invoke_model_with_response_stream.side_effect = generic_error
+        mock_boto3_client.errors = itertools.repeat(_INTERNAL_ERROR)
 
         client = BedrockClient()
 
@@ -218,7 +298,6 @@ class TestBedrockClient:
             async for _ in client.invoke_streaming("test prompt"):
                 pass
 
-    @pytest.mark.asyncio
     async def test_build_request_body(self, sample_config: Config):
         """Test request body construction.
 
@@ -237,7 +316,6 @@ class TestBedrockClient:
         assert len(body["system"]) == 1
         assert body["system"][0]["text"] == "system"
 
-    @pytest.mark.asyncio
     async def test_build_request_body_no_system(self, sample_config: Config):
         """Test request body without system context.
 
@@ -251,81 +329,421 @@ class TestBedrockClient:
         assert "system" not in body
         assert len(body["messages"]) == 1
 
-    @pytest.mark.asyncio
-    async def test_stream_response_parsing(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+    def test_build_request_body_caching_disabled(
+        self, make_client: Callable[..., BedrockClient]
     ):
-        """Test streaming response parsing.
+        """Test retrieved context is kept, unmarked, when caching is off.
+
+        Args:
+            make_client: BedrockClient factory fixture
+        """
+        client = make_client(enable_prompt_caching=False)
+
+        body = client._build_request_body(
+            "prompt", system_context="system", rag_context="project docs"
+        )
+
+        assert body["system"] == [
+            {"type": "text", "text": "system"},
+            {"type": "text", "text": "project docs"},
+        ]
+
+    def test_cache_breakpoint_on_empty_content(self, sample_config: Config):
+        """Test a history message with empty content gets no breakpoint.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
             sample_config: Sample config fixture
         """
         client = BedrockClient()
 
-        chunks = []
-        async for chunk in client.invoke_streaming("test prompt"):
-            chunks.append(chunk)
+        body = client._build_request_body(
+            "prompt", history=[{"role": "assistant", "content": []}]
+        )
+
+        assert body["messages"][0]["content"] == []
+
+    def test_build_request_body_cache_breakpoints(self, sample_config: Config):
+        """Test tools, system, retrieved context and history get breakpoints.
+
+        Args:
+            sample_config: Sample config fixture
+        """
+        client = BedrockClient()
+        tools = [
+            {"name": "read_file", "input_schema": {"type": "object"}},
+            {"name": "grep", "input_schema": {"type": "object"}},
+        ]
+        history = [
+            {"role": "user", "content": "What does main.py do?"},
+            {"role": "assistant", "content": "It starts the server."},
+        ]
+
+        body = client._build_request_body(
+            "And config.py?",
+            system_context="system",
+            tools=tools,
+            rag_context="project docs",
+            history=history,
+        )
+
+        ephemeral = {"type": "ephemeral"}
+        assert "cache_control" not in body["tools"][0]
+        assert body["tools"][-1]["cache_control"] == ephemeral
+        assert [block["text"] for block in body["system"]] == ["system", "project docs"]
+        assert all(block["cache_control"] == ephemeral for block in body["system"])
+        assert body["messages"][1]["content"] == [
+            {
+                "type": "text",
+                "text": "It starts the server.",
+                "cache_control": ephemeral,
+            }
+        ]
+        assert body["messages"][-1] == {"role": "user", "content": "And config.py?"}
+
+        # Caller-owned inputs are left untouched
+        assert "cache_control" not in tools[-1]
+        assert history[-1]["content"] == "It starts the server."
+
+    def test_simple_request_body_serialized_once(self, sample_config: Config):
+        """Test prompt-only bodies are memoized as JSON bytes.
+
+        Args:
+            sample_config: Sample config fixture
+        """
+        client = BedrockClient()
+
+        first = client._serialize_request_body("Say 'test'", "system")
+        second = client._serialize_request_body("Say 'test'", "system")
+        with_history = client._serialize_request_body(
+            "Say 'test'", "system", history=[{"role": "user", "content": "Hi"}]
+        )
+
+        assert first is second
+        assert json.loads(first) == client._build_request_body("Say 'test'", "system")
+        assert len(json.loads(with_history)["messages"]) == 2
+
+    async def test_stream_response_skips_non_delta_events(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test only content_block_delta events are parsed for text.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        mock_boto3_client.stream = iter(
+            [
+                {"chunk": {"bytes": b'{"type":"message_start","message":{}}'}},
+                {"chunk": {"bytes": b'{"type": "ping"}'}},
+                {
+                    "chunk": {
+                        "bytes": b'{"type": "content_block_delta", '
+                        b'"delta": {"type": "text_delta", "text": "Hi"}}'
+                    }
+                },
+                {"metadata": {}},
+                {"chunk": {"bytes": b'{"type":"message_stop"}'}},
+            ]
+        )
+
+        client = BedrockClient()
+
+        chunks = [chunk async for chunk in client.invoke_streaming("test prompt")]
+
+        assert chunks == ["Hi"]
+
+    async def test_stream_reads_do_not_block_event_loop(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test blocking event-stream reads run off the event loop thread.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        import asyncio
+        import time
+
+        def slow_body():
+            for text in ("Hello", " World"):
+                time.sleep(0.05)  # Blocking socket read
+                yield {
+                    "chunk": {
+                        "bytes": b'{"type":"content_block_delta","delta":'
+                        b'{"type":"text_delta","text":"' + text.encode() + b'"}}'
+                    }
+                }
+
+        mock_boto3_client.stream = slow_body()
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        client = BedrockClient()
+        chunks = [chunk async for chunk in client.invoke_streaming("test prompt")]
+        ticker_task.cancel()
 
         assert chunks == ["Hello", " World"]
+        assert ticks > 5
 
-    @pytest.mark.asyncio
-    async def test_empty_response_stream(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+    async def test_stream_error_mid_response(
+        self,
+        mock_boto3_client: Any,
+        sample_config: Config,
+        bedrock_stream_events: Mapping[str, dict[str, Any]],
     ):
-        """Test handling empty response stream.
+        """Test errors raised by the event stream reach the caller.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
+            bedrock_stream_events: Pre-encoded stream events fixture
         """
-        # Mock empty stream
-        mock_boto3_client.invoke_model_with_response_stream.return_value = {
-            "body": iter([])
+
+        def failing_body():
+            yield bedrock_stream_events["hello"]
+            raise ConnectionError("stream reset")
+
+        mock_boto3_client.stream = failing_body()
+
+        client = BedrockClient()
+        chunks = []
+        with pytest.raises(BedrockError, match="stream reset"):
+            async for chunk in client.invoke_streaming("test prompt"):
+                chunks.append(chunk)
+
+        assert chunks == ["Hello"]
+
+    async def test_stream_batches_small_deltas(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test batch_size coalesces deltas and flushes the remainder.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        words = ["one", " two", " three", " four", " five"]
+        mock_boto3_client.stream = iter(
+            {
+                "chunk": {
+                    "bytes": b'{"type":"content_block_delta","delta":'
+                    b'{"type":"text_delta","text":"' + word.encode() + b'"}}'
+                }
+            }
+            for word in words
+        )
+
+        client = BedrockClient()
+        chunks = [
+            chunk
+            async for chunk in client.invoke_streaming("test prompt", batch_size=8)
+        ]
+
+        assert "".join(chunks) == "".join(words)
+        assert len(chunks) < len(words)
+        assert all(len(chunk) >= 8 for chunk in chunks[:-1])
+
+    async def test_invoke_returns_full_text(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test invoke concatenates every streamed chunk.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        client = BedrockClient()
+
+        assert await client.invoke("test prompt") == "Hello World"
+
+    def test_backoff_delay_full_jitter(self, sample_config: Config):
+        """Test backoff delays are jittered and capped.
+
+        Args:
+            sample_config: Sample config fixture
+        """
+        client = BedrockClient()
+
+        for attempt in range(10):
+            ceiling = min(client.BACKOFF_CAP, client.BACKOFF_BASE * 2**attempt)
+            delays = {client._backoff_delay(attempt) for _ in range(20)}
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert len(delays) > 1
+
+    async def test_list_models_multi_region(
+        self, monkeypatch: pytest.MonkeyPatch, sample_config: Config
+    ):
+        """Test models from several regions are merged by modelId.
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+            sample_config: Sample config fixture
+        """
+        import boto3
+
+        catalog = {
+            "us-east-1": ["anthropic.claude-sonnet-4", "anthropic.claude-haiku"],
+            "us-west-2": ["anthropic.claude-sonnet-4", "anthropic.claude-opus"],
         }
 
+        def fake_client(service: str, region_name: str, **kwargs) -> MagicMock:
+            client = MagicMock()
+            client.list_foundation_models.return_value = {
+                "modelSummaries": [
+                    {"modelId": model_id, "region": region_name}
+                    for model_id in catalog.get(region_name, [])
+                ]
+            }
+            return client
+
+        monkeypatch.setattr(boto3, "client", fake_client)
         client = BedrockClient()
 
-        chunks = []
-        async for chunk in client.invoke_streaming("test prompt"):
-            chunks.append(chunk)
+        models = await client.list_available_models_multi(["us-east-1", "us-west-2"])
+
+        assert [m["modelId"] for m in models] == [
+            "anthropic.claude-sonnet-4",
+            "anthropic.claude-haiku",
+            "anthropic.claude-opus",
+        ]
+        assert models[0]["region"] == "us-east-1"
+
+    async def test_validate_connection_uses_sts(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test connection validation doesn't invoke the model.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        client = BedrockClient()
+
+        assert await client.validate_connection() is True
+        assert mock_boto3_client.calls == []
+
+    async def test_validate_connection_bad_credentials(
+        self, monkeypatch: pytest.MonkeyPatch, sample_config: Config
+    ):
+        """Test rejected credentials raise BedrockConnectionError.
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+            sample_config: Sample config fixture
+        """
+        import boto3
+
+        from claude_bedrock_cursor.utils.errors import BedrockConnectionError
+
+        sts = MagicMock()
+        sts.get_caller_identity.side_effect = ClientError(
+            error_response={
+                "Error": {"Code": "InvalidClientTokenId", "Message": "bad token"}
+            },
+            operation_name="GetCallerIdentity",
+        )
+        monkeypatch.setattr(boto3, "client", lambda service, **kwargs: sts)
+        client = BedrockClient()
+
+        with pytest.raises(BedrockConnectionError, match="bad token"):
+            await client.validate_connection()
+
+    @pytest.mark.parametrize(
+        ("attempt", "ceiling"),
+        [(0, 0.5), (1, 1.0), (2, 2.0), (3, 4.0), (5, 16.0), (6, 20.0), (10, 20.0)],
+    )
+    def test_exponential_backoff_delay(
+        self,
+        attempt: int,
+        ceiling: float,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_config: Config,
+    ):
+        """Test the backoff ceiling doubles per attempt up to BACKOFF_CAP.
 
-        assert chunks == []
+        Args:
+            attempt: Zero-based retry attempt
+            ceiling: Largest delay allowed for the attempt
+            monkeypatch: Pytest monkeypatch fixture
+            sample_config: Sample config fixture
+        """
+        # Always jitter to the top of the range
+        monkeypatch.setattr("random.uniform", lambda low, high: high)
 
-    def test_exponential_backoff_delay(self):
-        """Test exponential backoff calculation.
+        assert BedrockClient()._backoff_delay(attempt) == ceiling
+
+    async def test_throttling_backoff_sleeps(
+        self,
+        mock_boto3_client: Any,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_config: Config,
+    ):
+        """Test invoke_streaming sleeps the backoff delay between retries.
 
-        This test verifies the backoff algorithm used in invoke_streaming:
-        wait_time = 2**attempt (capped at 8 seconds)
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            monkeypatch: Pytest monkeypatch fixture
+            sample_config: Sample config fixture
         """
-        # Attempt 0: 2^0 = 1 second
-        assert 2**0 == 1
+        monkeypatch.setattr("random.uniform", lambda low, high: high)
+        sleep = AsyncMock()
+        monkeypatch.setattr("asyncio.sleep", sleep)
+        mock_boto3_client.errors = itertools.repeat(_THROTTLING_ERROR)
 
-        # Attempt 1: 2^1 = 2 seconds
-        assert 2**1 == 2
+        client = BedrockClient()
 
-        # Attempt 2: 2^2 = 4 seconds
-        assert 2**2 == 4
+        with pytest.raises(BedrockThrottlingError):
+            async for _ in client.invoke_streaming("test prompt", max_retries=4):
+                pass
 
-        # Attempt 3: 2^3 = 8 seconds
-        assert 2**3 == 8
+        # No sleep after the final attempt
+        assert sleep.await_args_list == [call(0.5), call(1.0), call(2.0)]
 
-        # Attempt 4: would be 16, but implementation caps at 8
-        assert 2**4 == 16  # Algorithm before capping
+    def test_boto_client_shared_across_instances(
+        self, monkeypatch: pytest.MonkeyPatch, sample_config: Config
+    ):
+        """Test boto3 clients are created once per service and region.
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+            sample_config: Sample config fixture
+        """
+        import boto3
+
+        factory = MagicMock(side_effect=lambda *a, **kw: MagicMock())
+        monkeypatch.setattr(boto3, "client", factory)
+
+        first = BedrockClient(region="us-east-1")
+        second = BedrockClient(region="us-east-1")
+        other_region = BedrockClient(region="us-west-2")
+
+        assert first.client is second.client
+        assert other_region.client is not first.client
+        assert factory.call_count == 2
+
+        boto_config = factory.call_args.kwargs["config"]
+        assert boto_config.tcp_keepalive is True
+        assert boto_config.max_pool_connections == 32
+        assert boto_config.retries["mode"] == "adaptive"
 
 
 @pytest.mark.unit
 class TestBedrockClientWithMetrics:
     """Test suite for BedrockClientWithMetrics class."""
 
-    @pytest.mark.asyncio
     async def test_metrics_tracking(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self, mock_boto3_client: Any, sample_config: Config
     ):
         """Test metrics are tracked during invocation.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
         client = BedrockClientWithMetrics()
@@ -345,26 +763,16 @@ class TestBedrockClientWithMetrics:
         assert metrics["output_tokens"] >= 0
         assert metrics["total_tokens"] > 0
 
-    @pytest.mark.asyncio
     async def test_metrics_failure_tracking(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self, mock_boto3_client: Any, sample_config: Config
     ):
         """Test metrics track failures.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
         """
-        error = ClientError(
-            error_response={
-                "Error": {
-                    "Code": "ValidationException",
-                    "Message": "Invalid parameters",
-                }
-            },
-            operation_name="InvokeModel",
-        )
-        mock_boto3_client.invoke_model_with_response_stream.side_effect = error
+        mock_boto3_client.errors = itertools.repeat(_VALIDATION_ERROR)
 
         client = BedrockClientWithMetrics()
 
@@ -380,33 +788,25 @@ class TestBedrockClientWithMetrics:
         assert metrics["input_tokens"] == 0
         assert metrics["output_tokens"] == 0
 
-    @pytest.mark.asyncio
     async def test_metrics_token_tracking(
-        self, mock_boto3_client: MagicMock, sample_config: Config
+        self,
+        mock_boto3_client: Any,
+        sample_config: Config,
+        bedrock_stream_events: Mapping[str, dict[str, Any]],
     ):
         """Test token usage metrics.
 
         Args:
-            mock_boto3_client: Mocked boto3 client fixture
+            mock_boto3_client: Fake Bedrock client fixture
             sample_config: Sample config fixture
+            bedrock_stream_events: Pre-encoded stream events fixture
         """
         # Add token usage to mock response
-        mock_stream = [
-            {
-                "chunk": {
-                    "bytes": b'{"type":"content_block_delta","delta":{"type":"text_delta","text":"Hello"}}'
-                }
-            },
-            {
-                "chunk": {
-                    "bytes": b'{"type":"message_delta","usage":{"output_tokens":10}}'
-                }
-            },
-            {"chunk": {"bytes": b'{"type":"message_stop"}'}},
-        ]
-        mock_boto3_client.invoke_model_with_response_stream.return_value = {
-            "body": iter(mock_stream)
-        }
+        mock_boto3_client.stream = (
+            bedrock_stream_events["hello"],
+            _USAGE_EVENT,
+            bedrock_stream_events["stop"],
+        )
 
         client = BedrockClientWithMetrics()
 
@@ -440,3 +840,164 @@ class TestBedrockClientWithMetrics:
         assert metrics["input_tokens"] == 0
         assert metrics["output_tokens"] == 0
         assert metrics["total_tokens"] == 0
+
+    async def test_metrics_estimate_tokens_without_usage(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test token estimates from text length when no usage is reported.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        texts = ["Hel", "lo wor", "ld ", " and", " more\n", "words"]
+        mock_boto3_client.stream = iter(
+            {
+                "chunk": {
+                    "bytes": orjson.dumps(
+                        {
+                            "type": "content_block_delta",
+                            "delta": {"type": "text_delta", "text": text},
+                        }
+                    )
+                }
+            }
+            for text in texts
+        )
+
+        client = BedrockClientWithMetrics()
+        async for _ in client.invoke_streaming("test prompt"):
+            pass
+
+        metrics = client.get_metrics()
+        assert metrics["output_tokens"] == 7  # 27 characters / 4, rounded up
+        assert metrics["input_tokens"] == 3  # "test prompt": 11 characters
+
+        # Retrieved context and history count toward the input estimate
+        mock_boto3_client.stream = iter([])
+        client.reset_metrics()
+        async for _ in client.invoke_streaming(
+            "test prompt",
+            rag_context="docs",
+            history=[
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": [{"type": "text", "text": "Hey"}]},
+            ],
+        ):
+            pass
+
+        assert client.get_metrics()["input_tokens"] == 5  # 20 characters
+
+    async def test_metrics_use_invocation_metrics(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test Bedrock invocation metrics on the final event are used.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        events = [
+            {
+                "type": "content_block_delta",
+                "delta": {"type": "text_delta", "text": "Hello"},
+            },
+            {
+                "type": "message_stop",
+                "amazon-bedrock-invocationMetrics": {
+                    "inputTokenCount": 21,
+                    "outputTokenCount": 3,
+                    "invocationLatency": 512,
+                    "firstByteLatency": 230,
+                },
+            },
+        ]
+        mock_boto3_client.stream = iter(
+            {"chunk": {"bytes": orjson.dumps(e)}} for e in events
+        )
+
+        client = BedrockClientWithMetrics()
+        async for _ in client.invoke_streaming("test prompt"):
+            pass
+
+        metrics = client.get_metrics()
+        assert metrics["input_tokens"] == 21
+        assert metrics["output_tokens"] == 3
+
+    async def test_metrics_use_reported_usage(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test billed token usage and cache reads/writes from the stream.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        events = [
+            {
+                "type": "message_start",
+                "message": {
+                    "usage": {
+                        "input_tokens": 12,
+                        "output_tokens": 1,
+                        "cache_read_input_tokens": 900,
+                        "cache_creation_input_tokens": 40,
+                    }
+                },
+            },
+            {
+                "type": "content_block_delta",
+                "delta": {"type": "text_delta", "text": "Hello"},
+            },
+            {"type": "message_delta", "usage": {"output_tokens": 7}},
+            {"type": "message_stop"},
+        ]
+        mock_boto3_client.stream = iter(
+            {"chunk": {"bytes": orjson.dumps(e)}} for e in events
+        )
+
+        client = BedrockClientWithMetrics()
+        async for _ in client.invoke_streaming("test prompt", "system instructions"):
+            pass
+
+        metrics = client.get_metrics()
+        assert metrics["input_tokens"] == 12
+        assert metrics["output_tokens"] == 7
+        assert metrics["cache_read_tokens"] == 900
+        assert metrics["cache_write_tokens"] == 40
+        assert metrics["cache_hits"] == 1
+
+    async def test_metrics_concurrent_requests(
+        self, mock_boto3_client: Any, sample_config: Config
+    ):
+        """Test concurrent streams are all counted in the metrics.
+
+        Args:
+            mock_boto3_client: Fake Bedrock client fixture
+            sample_config: Sample config fixture
+        """
+        events = [
+            {"type": "message_start", "message": {"usage": {"input_tokens": 10}}},
+            {
+                "type": "content_block_delta",
+                "delta": {"type": "text_delta", "text": "Hello"},
+            },
+            {"type": "message_delta", "usage": {"output_tokens": 2}},
+        ]
+        # A tuple body is re-iterable, so every request streams all events
+        mock_boto3_client.stream = tuple(
+            {"chunk": {"bytes": orjson.dumps(e)}} for e in events
+        )
+
+        client = BedrockClientWithMetrics()
+
+        async def consume() -> None:
+            async for _ in client.invoke_streaming("test prompt"):
+                pass
+
+        await asyncio.gather(*(consume() for _ in range(8)))
+
+        metrics = client.get_metrics()
+        assert metrics["request_count"] == 8
+        assert metrics["input_tokens"] == 80
+        assert metrics["output_tokens"] == 16
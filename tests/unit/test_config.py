@@ -1,35 +1,60 @@
 """Unit tests for configuration management."""
 
+import os
 from pathlib import Path
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
-from claude_bedrock_cursor.config import Config
+from claude_bedrock_cursor import config as config_module
+from claude_bedrock_cursor.config import Config, get_config, reload_env, set_config
+
+# Expected Config field defaults, checked on both the model and to_dict()
+_DEFAULTS = {
+    "aws_region": "us-east-1",
+    "bedrock_model_id": "anthropic.claude-sonnet-4-20250514-v1:0",
+    "max_output_tokens": 4096,
+    "max_thinking_tokens": 1024,
+    "enable_prompt_caching": True,
+    "enable_streaming": True,
+    "cursor_integration_mode": "both",
+}
 
 
 @pytest.mark.unit
 class TestConfig:
     """Test suite for Config class."""
 
-    def test_default_config(self):
-        """Test creating config with default values."""
-        config = Config()
+    def test_default_config(self, default_config: Config):
+        """Test creating config with default values, as attributes and dict.
 
-        assert config.aws_region == "us-east-1"
-        assert config.bedrock_model_id == "anthropic.claude-sonnet-4-20250514-v1:0"
-        assert config.max_output_tokens == 4096
-        assert config.max_thinking_tokens == 1024
-        assert config.enable_prompt_caching is True
-        assert config.enable_streaming is True
-        assert config.cursor_integration_mode == "both"
-
-    def test_config_from_toml(self, test_config_file: Path):
+        Args:
+            default_config: Shared default config fixture
+        """
+        config_dict = default_config.to_dict()
+
+        assert config_dict == default_config.model_dump()
+        for name, expected in _DEFAULTS.items():
+            assert getattr(default_config, name) == expected
+            assert config_dict[name] == expected
+
+    def test_config_from_toml(
+        self,
+        test_config_file: Path,
+        sample_config_data: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """Test loading config from TOML file.
 
         Args:
             test_config_file: Test config file fixture
+            sample_config_data: Session-parsed contents of test_config_file
+            monkeypatch: Pytest monkeypatch fixture
         """
+        monkeypatch.setattr(
+            config_module.tomllib, "loads", lambda _text: sample_config_data
+        )
         config = Config.from_toml(test_config_file)
 
         assert config.aws_region == "us-east-1"
@@ -39,29 +64,26 @@ class TestConfig:
         assert config.enable_prompt_caching is True
         assert config.cursor_integration_mode == "both"
 
-    def test_config_from_nonexistent_file(self, tmp_path: Path):
+    def test_config_from_nonexistent_file(self, test_config_dir: Path):
         """Test loading from non-existent file raises error.
 
         Args:
-            tmp_path: Pytest temporary directory
+            test_config_dir: Test config directory fixture
         """
-        nonexistent = tmp_path / "nonexistent.toml"
+        nonexistent = test_config_dir / "nonexistent.toml"
 
         with pytest.raises(FileNotFoundError, match="not found"):
             Config.from_toml(nonexistent)
 
-    def test_config_from_invalid_toml(self, tmp_path: Path):
+    def test_config_from_invalid_toml(self, invalid_toml_file: Path):
         """Test loading from invalid TOML raises error.
 
         Args:
-            tmp_path: Pytest temporary directory
+            invalid_toml_file: Invalid TOML file fixture
         """
-        invalid_toml = tmp_path / "invalid.toml"
-        invalid_toml.write_text("this is not valid toml [[[")
-
         # tomllib.TOMLDecodeError or tomli.TOMLDecodeError depending on Python version
         with pytest.raises((ValueError, Exception)):
-            Config.from_toml(invalid_toml)
+            Config.from_toml(invalid_toml_file)
 
     def test_max_output_tokens_validation(self):
         """Test MAX_OUTPUT_TOKENS must be at least 4096."""
@@ -74,18 +96,28 @@ class TestConfig:
         assert config.max_output_tokens == 8192
 
         # Invalid: less than 4096
-        with pytest.raises(ValidationError, match="greater than or equal to 4096"):
+        with pytest.raises(ValidationError) as exc_info:
             Config(max_output_tokens=2048)
+        error = exc_info.value.errors()[0]
+        assert (error["type"], error["loc"]) == (
+            "greater_than_equal",
+            ("max_output_tokens",),
+        )
+
+    def test_config_to_env_vars(self):
+        """Test converting config to environment variables."""
+        config = Config(
+            aws_region="eu-west-1", aws_profile=None, max_output_tokens=8192
+        )
 
-    def test_config_to_dict(self):
-        """Test converting config to dictionary."""
-        config = Config(aws_region="eu-west-1")
-        config_dict = config.to_dict()
+        env_vars = config.to_env_vars()
 
-        assert isinstance(config_dict, dict)
-        assert config_dict["aws_region"] == "eu-west-1"
-        assert config_dict["max_output_tokens"] == 4096
+        assert env_vars["AWS_REGION"] == "eu-west-1"
+        assert env_vars["MAX_OUTPUT_TOKENS"] == "8192"
+        assert env_vars["ENABLE_PROMPT_CACHING"] == "True"
+        assert "AWS_PROFILE" not in env_vars  # None values are skipped
 
+    @pytest.mark.slow
     def test_config_from_env_vars(self, monkeypatch: pytest.MonkeyPatch):
         """Test loading config from environment variables.
 
@@ -105,11 +137,15 @@ class TestConfig:
         assert config.max_output_tokens == 8192
         assert config.enable_prompt_caching is False
 
+    @pytest.mark.slow
     def test_config_validation_invalid_region(self):
         """Test validation rejects invalid AWS region."""
-        with pytest.raises(ValidationError, match="Invalid AWS region"):
+        with pytest.raises(ValidationError) as exc_info:
             Config(aws_region="invalid-region-123")
+        error = exc_info.value.errors()[0]
+        assert (error["type"], error["loc"]) == ("value_error", ("aws_region",))
 
+    @pytest.mark.slow
     def test_config_model_id_pattern(self):
         """Test Bedrock model ID pattern validation."""
         # Valid Claude model ID
@@ -128,23 +164,28 @@ class TestConfig:
             assert config.cursor_integration_mode == mode
 
         # Invalid mode
-        with pytest.raises(ValidationError, match="Input should be"):
+        with pytest.raises(ValidationError) as exc_info:
             Config(cursor_integration_mode="invalid")
+        error = exc_info.value.errors()[0]
+        assert (error["type"], error["loc"]) == (
+            "literal_error",
+            ("cursor_integration_mode",),
+        )
 
-    def test_config_partial_toml(self, tmp_path: Path):
+    def test_config_partial_toml(
+        self, partial_toml_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test loading partial TOML with defaults.
 
         Args:
-            tmp_path: Pytest temporary directory
+            partial_toml_file: Partial config file fixture
+            monkeypatch: Pytest monkeypatch fixture
         """
-        partial_toml = tmp_path / "partial.toml"
-        partial_toml.write_text(
-            """
-aws_region = "eu-central-1"
-"""
+        monkeypatch.setattr(
+            config_module.tomllib, "loads", lambda _text: {"aws_region": "eu-central-1"}
         )
 
-        config = Config.from_toml(partial_toml)
+        config = Config.from_toml(partial_toml_file)
 
         # Specified value
         assert config.aws_region == "eu-central-1"
@@ -152,3 +193,94 @@ aws_region = "eu-central-1"
         # Default values should still apply
         assert config.bedrock_model_id == "anthropic.claude-sonnet-4-20250514-v1:0"
         assert config.max_output_tokens == 4096
+
+    def test_config_instance_not_revalidated(self, default_config: Config):
+        """Test an existing Config passes through validation as-is.
+
+        Args:
+            default_config: Shared default config fixture
+        """
+        assert Config.model_validate(default_config) is default_config
+
+    def test_from_toml_cached_until_modified(self, tmp_path: Path):
+        """Test from_toml reuses a parse until the file's mtime changes.
+
+        Args:
+            tmp_path: Pytest temporary directory
+        """
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('aws_region = "eu-west-1"\n')
+
+        first = Config.from_toml(config_file)
+        first.aws_region = "us-west-2"
+        assert Config.from_toml(config_file).aws_region == "eu-west-1"
+
+        config_file.write_text('aws_region = "ap-south-1"\n')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert Config.from_toml(config_file).aws_region == "ap-south-1"
+
+    def test_config_write_toml_round_trip(self, tmp_path: Path):
+        """Test write_toml output loads back through from_toml.
+
+        Args:
+            tmp_path: Pytest temporary directory
+        """
+        config_file = tmp_path / "config.toml"
+        config = Config(
+            aws_region="eu-west-1",
+            aws_profile=None,
+            bedrock_model_id='model "quoted"',
+            enable_streaming=False,
+            monthly_budget_usd=42.5,
+        )
+
+        config.write_toml(config_file)
+
+        assert Config.from_toml(config_file).to_dict() == config.to_dict()
+
+
+@pytest.mark.unit
+class TestGlobalConfig:
+    """Test suite for the global config accessors."""
+
+    def test_get_config_cached(self):
+        """Test repeated get_config calls return the same instance."""
+        assert get_config() is get_config()
+
+    def test_set_config_overrides_cache(self):
+        """Test set_config replaces an already cached instance."""
+        get_config()
+        custom = Config(aws_region="us-west-2")
+
+        set_config(custom)
+
+        assert get_config() is custom
+
+    def test_env_snapshot_reused_until_reload(self, monkeypatch: pytest.MonkeyPatch):
+        """Test environment variables are parsed once until reload_env().
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        assert Config().aws_region == "eu-west-1"
+
+        monkeypatch.setenv("AWS_REGION", "ap-south-1")
+        assert Config().aws_region == "eu-west-1"
+
+        reload_env()
+        assert Config().aws_region == "ap-south-1"
+
+    async def test_set_config_visible_to_worker_threads(self):
+        """Test a set_config override reaches threads and copied contexts."""
+        import asyncio
+        import contextvars
+
+        custom = Config(aws_region="us-west-2")
+        context = contextvars.copy_context()
+
+        set_config(custom)
+
+        assert await asyncio.to_thread(get_config) is custom
+        assert context.run(get_config) is custom
@@ -1,10 +1,15 @@
 """Unit tests for OAuth authentication manager."""
 
+import dataclasses
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
+import orjson
 import pytest
 
+from claude_bedrock_cursor.auth import oauth
 from claude_bedrock_cursor.auth.oauth import OAuthManager, TokenPair
 from claude_bedrock_cursor.utils.errors import (
     AuthenticationError,
@@ -12,6 +17,9 @@ from claude_bedrock_cursor.utils.errors import (
     TokenRefreshError,
 )
 
+# Serve every OAuth request from the mock transport
+pytestmark = pytest.mark.usefixtures("mock_oauth_http")
+
 
 @pytest.mark.unit
 class TestTokenPair:
@@ -37,6 +45,14 @@ class TestTokenPair:
         assert pair.refresh_token == sample_refresh_token
         assert pair.expires_at == expires_at
 
+    def test_token_pair_is_immutable(self):
+        """Test TokenPair is frozen and carries no instance __dict__."""
+        pair = TokenPair(access_token="a", refresh_token="r", expires_at=0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pair.access_token = "b"  # type: ignore[misc]
+        assert not hasattr(pair, "__dict__")
+
     def test_token_pair_is_expired(self):
         """Test checking if token pair is expired."""
         # Not expired (5 minutes from now)
@@ -71,7 +87,6 @@ class TestTokenPair:
 class TestOAuthManager:
     """Test suite for OAuthManager class."""
 
-    @pytest.mark.asyncio
     async def test_get_oauth_token_from_claude_cli(
         self, mock_subprocess_run: MagicMock, mock_keyring: dict[str, str]
     ):
@@ -88,7 +103,6 @@ class TestOAuthManager:
         assert token == "test_oauth_token_from_claude_setup"
         mock_subprocess_run.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_oauth_token_cli_failure(
         self, mock_subprocess_run: MagicMock, mock_keyring: dict[str, str]
     ):
@@ -106,100 +120,266 @@ class TestOAuthManager:
         with pytest.raises(AuthenticationError, match="Failed to get OAuth token"):
             await manager._get_oauth_token_from_claude_cli()
 
-    @pytest.mark.asyncio
+    async def test_claude_cli_path_resolved_once(
+        self, mock_subprocess_run: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the claude executable is looked up on PATH only once.
+
+        Args:
+            mock_subprocess_run: Mocked subprocess.run fixture
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        import shutil
+
+        which = MagicMock(return_value="/opt/bin/claude")
+        monkeypatch.setattr(shutil, "which", which)
+        monkeypatch.setattr(OAuthManager, "_CLAUDE_PATH", None)
+        mock_subprocess_run.return_value.stdout = b"Your OAuth token: oauth_abc\n"
+
+        manager = OAuthManager()
+        assert await manager._get_claude_oauth_token() == "oauth_abc"
+        assert await manager._get_claude_oauth_token() == "oauth_abc"
+
+        which.assert_called_once_with("claude")
+        assert mock_subprocess_run.call_args.args[0] == [
+            "/opt/bin/claude",
+            "setup-token",
+        ]
+
+    async def test_claude_cli_output_parsing(self, mock_subprocess_run: MagicMock):
+        """Test the token is taken from the last marker in the CLI output.
+
+        Args:
+            mock_subprocess_run: Mocked subprocess.run fixture
+        """
+        manager = OAuthManager()
+
+        mock_subprocess_run.return_value.stdout = (
+            b"Welcome to Claude Code\nOpening browser...\n"
+            b"Your OAuth token:   oauth_xyz  \n"
+        )
+        assert await manager._get_claude_oauth_token() == "oauth_xyz"
+
+        mock_subprocess_run.return_value.stdout = b"Something went sideways\n"
+        with pytest.raises(AuthenticationError, match="Could not parse"):
+            await manager._get_claude_oauth_token()
+
+    async def test_claude_cli_timeout_kills_process(
+        self, mock_subprocess_run: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a hung claude CLI is killed without blocking the event loop.
+
+        Args:
+            mock_subprocess_run: Mocked subprocess.run fixture
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        import asyncio
+
+        async def hang() -> tuple[bytes, bytes]:
+            await asyncio.sleep(10)
+            return b"", b""
+
+        proc = MagicMock()
+        proc.communicate = hang
+        proc.wait = AsyncMock(return_value=-9)
+        monkeypatch.setattr(
+            asyncio, "create_subprocess_exec", AsyncMock(return_value=proc)
+        )
+        monkeypatch.setattr(OAuthManager, "SETUP_TOKEN_TIMEOUT", 0.01)
+
+        manager = OAuthManager()
+
+        with pytest.raises(AuthenticationError, match="timed out"):
+            await manager._get_claude_oauth_token()
+        proc.kill.assert_called_once()
+
+    async def test_claude_cli_not_installed(self, monkeypatch: pytest.MonkeyPatch):
+        """Test a missing claude CLI raises with an install hint.
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        import shutil
+
+        monkeypatch.setattr(shutil, "which", MagicMock(return_value=None))
+        monkeypatch.setattr(OAuthManager, "_CLAUDE_PATH", None)
+
+        manager = OAuthManager()
+
+        with pytest.raises(AuthenticationError, match="npm install"):
+            await manager._get_claude_oauth_token()
+
     async def test_exchange_oauth_token_for_tokens(
-        self, mock_httpx_client: AsyncMock, mock_keyring: dict[str, str]
+        self, oauth_token_endpoint: MagicMock, mock_keyring: dict[str, str]
     ):
         """Test exchanging OAuth token for access + refresh tokens.
 
         Args:
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
             mock_keyring: Mocked keyring fixture
         """
         manager = OAuthManager()
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            pair = await manager._exchange_oauth_token("test_oauth_token")
+        pair = await manager._exchange_oauth_token("test_oauth_token")
 
-        assert pair.access_token == "test_access_token"
-        assert pair.refresh_token == "test_refresh_token"
+        assert pair.access_token == "new_access_token"
+        assert pair.refresh_token == "new_refresh_token"
         assert not pair.is_expired()
 
-    @pytest.mark.asyncio
     async def test_exchange_oauth_token_failure(
-        self, mock_httpx_client: AsyncMock, mock_keyring: dict[str, str]
+        self, oauth_token_endpoint: MagicMock, mock_keyring: dict[str, str]
     ):
         """Test OAuth exchange fails with invalid response.
 
         Args:
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
             mock_keyring: Mocked keyring fixture
         """
-        mock_httpx_client.post.return_value.status_code = 401
-        mock_httpx_client.post.return_value.json.return_value = {
-            "error": "invalid_token"
-        }
+        oauth_token_endpoint.return_value = httpx.Response(
+            401, json={"error": "invalid_token"}
+        )
 
         manager = OAuthManager()
 
-        with (
-            patch("httpx.AsyncClient", return_value=mock_httpx_client),
-            pytest.raises(AuthenticationError, match="Failed to exchange OAuth token"),
-        ):
+        with pytest.raises(AuthenticationError, match="Failed to exchange OAuth token"):
             await manager._exchange_oauth_token("invalid_oauth_token")
 
-    @pytest.mark.asyncio
     async def test_login_flow(
         self,
         mock_subprocess_run: MagicMock,
-        mock_httpx_client: AsyncMock,
         mock_keyring: dict[str, str],
     ):
         """Test complete login flow.
 
         Args:
             mock_subprocess_run: Mocked subprocess.run fixture
-            mock_httpx_client: Mocked httpx client fixture
             mock_keyring: Mocked keyring fixture
         """
         manager = OAuthManager()
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            pair = await manager.login()
+        pair = await manager.login()
 
-        assert pair.access_token == "test_access_token"
-        assert pair.refresh_token == "test_refresh_token"
+        assert pair.access_token == "new_access_token"
+        assert pair.refresh_token == "new_refresh_token"
 
         # Verify tokens were stored
-        assert mock_keyring["claude-bedrock-cursor:access_token"] == "test_access_token"
+        assert mock_keyring["claude-bedrock-cursor:access_token"] == "new_access_token"
         assert (
-            mock_keyring["claude-bedrock-cursor:refresh_token"] == "test_refresh_token"
+            mock_keyring["claude-bedrock-cursor:refresh_token"] == "new_refresh_token"
         )
 
-    @pytest.mark.asyncio
+    async def test_login_reuses_claude_cli_token(
+        self,
+        oauth_token_endpoint: MagicMock,
+        mock_subprocess_run: MagicMock,
+        mock_keyring: dict[str, str],
+    ):
+        """Test repeated logins run the Claude CLI once until it is rejected.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            mock_subprocess_run: Mocked subprocess.run fixture
+            mock_keyring: Mocked keyring fixture
+        """
+        mock_subprocess_run.return_value.stdout = b"Your OAuth token: oauth_abc\n"
+        manager = OAuthManager()
+
+        await manager.login()
+        await manager.login()
+        mock_subprocess_run.assert_called_once()
+
+        # A rejected exchange forgets the token, so the CLI runs again
+        oauth_token_endpoint.return_value = httpx.Response(400, text="used code")
+        with pytest.raises(AuthenticationError):
+            await manager.login()
+        assert manager._oauth_token is None
+
+    async def test_login_warms_up_token_endpoint(
+        self,
+        oauth_token_endpoint: MagicMock,
+        mock_keyring: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test login opens the token endpoint connection during the CLI run.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            mock_keyring: Mocked keyring fixture
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        import asyncio
+
+        async def slow_cli(self: OAuthManager) -> str:
+            await asyncio.sleep(0.01)  # Long enough for the warm-up to finish
+            return "oauth_abc"
+
+        monkeypatch.setattr(OAuthManager, "_get_claude_oauth_token", slow_cli)
+        manager = OAuthManager()
+
+        await manager.login()
+
+        methods = [call.args[0].method for call in oauth_token_endpoint.call_args_list]
+        assert methods == ["HEAD", "POST"]
+
+        # Later logins reuse the CLI token and skip the warm-up
+        await manager.login()
+        assert oauth_token_endpoint.call_count == 3
+
+    async def test_login_does_not_wait_for_warm_up(
+        self,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
+        mock_subprocess_run: MagicMock,
+        mock_keyring: dict[str, str],
+    ):
+        """Test a stalled warm-up is cancelled once the CLI returns.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token endpoint response factory fixture
+            mock_subprocess_run: Mocked subprocess.run fixture
+            mock_keyring: Mocked keyring fixture
+        """
+        import asyncio
+
+        async def unreachable_for_head(request: httpx.Request) -> httpx.Response:
+            if request.method == "HEAD":
+                await asyncio.Event().wait()  # Never answers
+            return token_response()
+
+        oauth_token_endpoint.side_effect = unreachable_for_head
+        mock_subprocess_run.return_value.stdout = b"Your OAuth token: oauth_abc\n"
+
+        tokens = await asyncio.wait_for(OAuthManager().login(), timeout=1)
+
+        assert tokens.access_token == "new_access_token"
+
+    @pytest.mark.parametrize(
+        "refresh_token_in_keyring", ["old_refresh_token"], indirect=True
+    )
     async def test_refresh_access_token(
-        self, mock_httpx_client: AsyncMock, mock_keyring: dict[str, str]
+        self,
+        oauth_token_endpoint: MagicMock,
+        mock_keyring: dict[str, str],
+        refresh_token_in_keyring: str,
+        token_response: Callable[..., httpx.Response],
     ):
         """Test refresh token rotation.
 
         Args:
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
             mock_keyring: Mocked keyring fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+            token_response: Token response factory fixture
         """
-        # Setup: store initial refresh token
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "old_refresh_token"
-
         # Mock refresh response with NEW refresh token
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "new_access_token",
-            "refresh_token": "new_refresh_token",  # Important: rotated!
-            "expires_in": 300,
-        }
+        oauth_token_endpoint.return_value = token_response(
+            "new_access_token", "new_refresh_token"
+        )
 
         manager = OAuthManager()
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            pair = await manager.refresh_access_token()
+        pair = await manager.refresh_access_token()
 
         # Verify new tokens
         assert pair.access_token == "new_access_token"
@@ -211,7 +391,6 @@ class TestOAuthManager:
             mock_keyring["claude-bedrock-cursor:refresh_token"] == "new_refresh_token"
         )
 
-    @pytest.mark.asyncio
     async def test_refresh_token_not_found(self, mock_keyring: dict[str, str]):
         """Test refresh fails when no refresh token stored.
 
@@ -223,37 +402,87 @@ class TestOAuthManager:
         with pytest.raises(NotAuthenticatedError, match="No refresh token found"):
             await manager.refresh_access_token()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "refresh_token_in_keyring", ["invalid_refresh"], indirect=True
+    )
     async def test_refresh_token_failure(
-        self, mock_httpx_client: AsyncMock, mock_keyring: dict[str, str]
+        self, oauth_token_endpoint: MagicMock, refresh_token_in_keyring: str
     ):
         """Test refresh fails with invalid refresh token.
 
         Args:
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+        """
+        oauth_token_endpoint.return_value = httpx.Response(401)
+
+        manager = OAuthManager()
+
+        with pytest.raises(TokenRefreshError, match="Failed to refresh access token"):
+            await manager.refresh_access_token()
+
+    async def test_refresh_uses_token_rotated_elsewhere(
+        self,
+        oauth_token_endpoint: MagicMock,
+        mock_keyring: dict[str, str],
+        refresh_token_in_keyring: str,
+    ):
+        """Test refresh reads the keyring instead of a stale cached token.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            mock_keyring: Mocked keyring fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+        """
+        manager = OAuthManager()
+        assert manager.storage.get_token("refresh_token") == refresh_token_in_keyring
+
+        # Another process rotates the token after this one cached it
+        mock_keyring["claude-bedrock-cursor:refresh_token"] = "rotated_elsewhere"
+        await manager.refresh_access_token()
+
+        request = oauth_token_endpoint.call_args.args[0]
+        assert orjson.loads(request.content)["refresh_token"] == "rotated_elsewhere"
+
+    async def test_refresh_401_keeps_tokens_rotated_elsewhere(
+        self,
+        oauth_token_endpoint: MagicMock,
+        mock_keyring: dict[str, str],
+        refresh_token_in_keyring: str,
+    ):
+        """Test a rejected refresh doesn't delete another process's new tokens.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
             mock_keyring: Mocked keyring fixture
+            refresh_token_in_keyring: Stored refresh token fixture
         """
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "invalid_refresh"
-        mock_httpx_client.post.return_value.status_code = 401
+        key = "claude-bedrock-cursor:refresh_token"
 
+        def rotated_then_rejected(request: httpx.Request) -> httpx.Response:
+            # Another process wins the rotation while this request is in flight
+            mock_keyring[key] = "rotated_elsewhere"
+            return httpx.Response(401, json={"error": "invalid_grant"})
+
+        oauth_token_endpoint.side_effect = rotated_then_rejected
         manager = OAuthManager()
 
-        with (
-            patch("httpx.AsyncClient", return_value=mock_httpx_client),
-            pytest.raises(TokenRefreshError, match="Failed to refresh access token"),
-        ):
+        with pytest.raises(NotAuthenticatedError):
             await manager.refresh_access_token()
 
-    @pytest.mark.asyncio
-    async def test_logout(self, mock_keyring: dict[str, str]):
+        assert mock_keyring[key] == "rotated_elsewhere"
+
+    async def test_logout(
+        self, mock_keyring: dict[str, str], refresh_token_in_keyring: str
+    ):
         """Test logout clears all tokens.
 
         Args:
             mock_keyring: Mocked keyring fixture
+            refresh_token_in_keyring: Stored refresh token fixture
         """
-        # Setup: store tokens
+        # Add access token
         mock_keyring["claude-bedrock-cursor:access_token"] = "test_access"
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "test_refresh"
 
         manager = OAuthManager()
         await manager.logout()
@@ -262,7 +491,42 @@ class TestOAuthManager:
         assert "claude-bedrock-cursor:access_token" not in mock_keyring
         assert "claude-bedrock-cursor:refresh_token" not in mock_keyring
 
-    def test_is_authenticated(self, mock_keyring: dict[str, str]):
+    async def test_logout_revokes_in_background(
+        self, mock_keyring: dict[str, str], refresh_token_in_keyring: str
+    ):
+        """Test logout clears storage without waiting for the revoke call.
+
+        Args:
+            mock_keyring: Mocked keyring fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+        """
+        import asyncio
+
+        revoke_started = asyncio.Event()
+        release_revoke = asyncio.Event()
+
+        async def slow_post(*args, **kwargs):
+            revoke_started.set()
+            await release_revoke.wait()
+
+        manager = OAuthManager()
+        manager.client = MagicMock()
+        manager.client.post = AsyncMock(side_effect=slow_post)
+
+        await manager.logout()
+
+        # Storage is already cleared while the revoke is still in flight
+        assert mock_keyring == {}
+        await revoke_started.wait()
+        release_revoke.set()
+        await manager.drain()
+
+        manager.client.post.assert_awaited_once()
+        assert manager.client.post.call_args.kwargs["content"] == (
+            b'{"token":"test_refresh"}'
+        )
+
+    async def test_is_authenticated(self, mock_keyring: dict[str, str]):
         """Test checking authentication status.
 
         Args:
@@ -271,28 +535,31 @@ class TestOAuthManager:
         manager = OAuthManager()
 
         # Initially not authenticated
-        assert not manager.is_authenticated()
+        assert not await manager.is_authenticated()
 
-        # Store tokens
-        mock_keyring["claude-bedrock-cursor:access_token"] = "test_access"
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "test_refresh"
+        # Store tokens (through storage, which drops the miss it just saw)
+        await manager.storage.astore_token("access_token", "test_access")
+        await manager.storage.astore_token("refresh_token", "test_refresh")
+        assert mock_keyring["claude-bedrock-cursor:refresh_token"] == "test_refresh"
 
         # Now authenticated
-        assert manager.is_authenticated()
+        assert await manager.is_authenticated()
 
-    @pytest.mark.asyncio
     async def test_get_valid_access_token_cached(
-        self, mock_keyring: dict[str, str], sample_access_token: str
+        self,
+        mock_keyring: dict[str, str],
+        sample_access_token: str,
+        refresh_token_in_keyring: str,
     ):
         """Test getting valid cached access token.
 
         Args:
             mock_keyring: Mocked keyring fixture
             sample_access_token: Sample access token fixture
+            refresh_token_in_keyring: Stored refresh token fixture
         """
         # Store valid token with future expiry
         mock_keyring["claude-bedrock-cursor:access_token"] = sample_access_token
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "test_refresh"
 
         # Store expiry timestamp (5 minutes from now)
         future_timestamp = int((datetime.now(UTC) + timedelta(minutes=5)).timestamp())
@@ -305,23 +572,84 @@ class TestOAuthManager:
 
         assert token == sample_access_token
 
-    @pytest.mark.asyncio
+    async def test_get_valid_access_token_served_from_memory(
+        self,
+        mock_keyring: dict[str, str],
+        sample_access_token: str,
+        refresh_token_in_keyring: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test a loaded token pair is reused without reading storage again.
+
+        Args:
+            mock_keyring: Mocked keyring fixture
+            sample_access_token: Sample access token fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        mock_keyring["claude-bedrock-cursor:access_token"] = sample_access_token
+        future_timestamp = int((datetime.now(UTC) + timedelta(minutes=5)).timestamp())
+        mock_keyring["claude-bedrock-cursor:access_token_expires_at"] = str(
+            future_timestamp
+        )
+
+        manager = OAuthManager()
+        assert await manager.get_valid_access_token() == sample_access_token
+
+        aget_token = AsyncMock()
+        monkeypatch.setattr(manager.storage, "aget_token", aget_token)
+
+        assert await manager.get_valid_access_token() == sample_access_token
+        aget_token.assert_not_awaited()
+
+    async def test_proactive_refresh_scheduled(
+        self,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
+        refresh_token_in_keyring: str,
+    ):
+        """Test a long-lived manager refreshes ahead of expiry in the background.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token endpoint response factory fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+        """
+        async with OAuthManager(proactive_refresh=True) as manager:
+            await manager.refresh_access_token()
+            scheduled = manager._refresh_task
+            assert scheduled is not None
+            assert not scheduled.done()
+
+            # Run the scheduled refresh now instead of sleeping until it's due
+            oauth_token_endpoint.return_value = token_response(
+                access_token="proactive_access", refresh_token="proactive_refresh"
+            )
+            await manager._delayed_refresh(0)
+
+            assert await manager.get_valid_access_token() == "proactive_access"
+            assert oauth_token_endpoint.call_count == 2
+            assert manager._refresh_task not in (None, scheduled)
+
+        assert manager._refresh_task is None
+
     async def test_get_valid_access_token_auto_refresh(
         self,
-        mock_httpx_client: AsyncMock,
+        oauth_token_endpoint: MagicMock,
         mock_keyring: dict[str, str],
         sample_access_token: str,
+        refresh_token_in_keyring: str,
     ):
         """Test auto-refresh when access token expired.
 
         Args:
-            mock_httpx_client: Mocked httpx client fixture
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
             mock_keyring: Mocked keyring fixture
             sample_access_token: Sample access token fixture
+            refresh_token_in_keyring: Stored refresh token fixture
         """
         # Store expired token
         mock_keyring["claude-bedrock-cursor:access_token"] = "expired_token"
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "test_refresh"
 
         # Store past expiry timestamp
         past_timestamp = int((datetime.now(UTC) - timedelta(minutes=5)).timestamp())
@@ -331,53 +659,233 @@ class TestOAuthManager:
 
         manager = OAuthManager()
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            token = await manager.get_valid_access_token()
+        token = await manager.get_valid_access_token()
 
         # Should return refreshed token
-        assert token == "test_access_token"
+        assert token == "new_access_token"
 
-    @pytest.mark.asyncio
-    async def test_token_rotation_security(
-        self, mock_httpx_client: AsyncMock, mock_keyring: dict[str, str]
+    async def test_get_valid_access_token_refreshes_before_expiry(
+        self, mock_keyring: dict[str, str], refresh_token_in_keyring: str
     ):
-        """Test that refresh token is rotated on every use.
+        """Test token is refreshed proactively when close to expiry.
 
         Args:
-            mock_httpx_client: Mocked httpx client fixture
             mock_keyring: Mocked keyring fixture
+            refresh_token_in_keyring: Stored refresh token fixture
         """
-        mock_keyring["claude-bedrock-cursor:refresh_token"] = "refresh_v1"
+        mock_keyring["claude-bedrock-cursor:access_token"] = "expiring_token"
+
+        # Expires in 30 seconds, inside the refresh skew window
+        soon_timestamp = int((datetime.now(UTC) + timedelta(seconds=30)).timestamp())
+        mock_keyring["claude-bedrock-cursor:access_token_expires_at"] = str(
+            soon_timestamp
+        )
+
+        manager = OAuthManager()
+        manager.refresh_access_token = AsyncMock(  # type: ignore[method-assign]
+            return_value=TokenPair(
+                access_token="fresh_token",
+                refresh_token="new_refresh",
+                expires_at=soon_timestamp + 300,
+            )
+        )
+
+        token = await manager.get_valid_access_token()
+
+        assert token == "fresh_token"
+        manager.refresh_access_token.assert_awaited_once()
+
+    @pytest.mark.parametrize("refresh_token_in_keyring", ["refresh_v1"], indirect=True)
+    async def test_token_rotation_security(
+        self,
+        oauth_token_endpoint: MagicMock,
+        refresh_token_in_keyring: str,
+        token_response: Callable[..., httpx.Response],
+    ):
+        """Test that refresh token is rotated on every use.
 
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+            token_response: Token response factory fixture
+        """
         # First refresh
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "access_v2",
-            "refresh_token": "refresh_v2",
-            "expires_in": 300,
-        }
+        oauth_token_endpoint.return_value = token_response("access_v2", "refresh_v2")
 
         manager = OAuthManager()
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            pair1 = await manager.refresh_access_token()
+        pair1 = await manager.refresh_access_token()
 
         assert pair1.refresh_token == "refresh_v2"
 
         # Second refresh should use new refresh token
-        mock_httpx_client.post.return_value.json.return_value = {
-            "access_token": "access_v3",
-            "refresh_token": "refresh_v3",
-            "expires_in": 300,
-        }
+        oauth_token_endpoint.return_value = token_response("access_v3", "refresh_v3")
 
-        with patch("httpx.AsyncClient", return_value=mock_httpx_client):
-            pair2 = await manager.refresh_access_token()
+        pair2 = await manager.refresh_access_token()
 
         assert pair2.refresh_token == "refresh_v3"
 
         # Verify tokens are different (rotation occurred)
         assert pair1.refresh_token != pair2.refresh_token
 
+    @pytest.mark.parametrize("refresh_token_in_keyring", ["refresh_v1"], indirect=True)
+    async def test_concurrent_refresh_single_request(
+        self,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
+        refresh_token_in_keyring: str,
+    ):
+        """Test concurrent refreshes share one rotation.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token endpoint response factory fixture
+            refresh_token_in_keyring: Stored refresh token fixture
+        """
+        import asyncio
+
+        async def slow_token_endpoint(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)  # Let the other refreshes queue up
+            return token_response("access_v2", "refresh_v2")
+
+        oauth_token_endpoint.side_effect = slow_token_endpoint
+        manager = OAuthManager()
+
+        results = await asyncio.gather(
+            manager.refresh_access_token(),
+            manager.refresh_access_token(),
+            manager.refresh_access_token(),
+        )
+
+        # Only the first caller posts the (single-use) refresh token
+        oauth_token_endpoint.assert_called_once()
+        assert {pair.refresh_token for pair in results} == {"refresh_v2"}
+
+    async def test_token_expiry_from_response(
+        self,
+        oauth_token_endpoint: MagicMock,
+        token_response: Callable[..., httpx.Response],
+        mock_keyring: dict[str, str],
+        sample_access_token: str,
+    ):
+        """Test expiry comes from the JWT exp claim, then expires_in.
+
+        Args:
+            oauth_token_endpoint: Mock OAuth endpoint handler fixture
+            token_response: Token endpoint response factory fixture
+            mock_keyring: Mocked keyring fixture
+            sample_access_token: Sample access token fixture
+        """
+        manager = OAuthManager()
+
+        # JWT access token: exp claim wins over expires_in
+        oauth_token_endpoint.return_value = token_response(
+            sample_access_token, "refresh_1", expires_in=300
+        )
+        pair = await manager._exchange_oauth_token("oauth_token")
+        assert pair.expires_at == 1735689600
+
+        # Opaque access token: expires_in is used
+        oauth_token_endpoint.return_value = token_response(
+            "opaque_access", "refresh_2", expires_in=600
+        )
+        pair = await manager._exchange_oauth_token("oauth_token")
+        expected = int(datetime.now(UTC).timestamp()) + 600
+        assert abs(pair.expires_at - expected) < 2
+
+    def test_managers_share_http_client(self, mock_keyring: dict[str, str]):
+        """Test OAuth managers reuse one pooled HTTP client.
+
+        Args:
+            mock_keyring: Mocked keyring fixture
+        """
+        manager1 = OAuthManager()
+        manager2 = OAuthManager()
+        private = OAuthManager(owns_client=True)
+
+        assert manager1.client is manager2.client
+        assert private.client is not manager1.client
+
+    @pytest.mark.filterwarnings("ignore::ResourceWarning")
+    def test_shared_client_survives_new_event_loop(
+        self, keepalive_http_server: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test separate asyncio.run calls each get a client for their loop.
+
+        Args:
+            keepalive_http_server: Local keep-alive HTTP server URL fixture
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        import asyncio
+        import gc
+
+        # Real sockets instead of the module's mock transport
+        monkeypatch.setattr(oauth, "_SHARED_CLIENT", None)
+        manager = OAuthManager()
+
+        async def post(close: bool = False) -> int:
+            response = await manager._post_json(keepalive_http_server, {})
+            if close:
+                await oauth.close_shared_client()
+            return response.status_code
+
+        assert asyncio.run(post()) == 200
+        # The first loop's pooled connection must not be reused here
+        assert asyncio.run(post(close=True)) == 200
+
+        # The first client's sockets died with its loop; collect them now
+        gc.collect()
+
+    async def test_requires_auth_reuses_manager(
+        self, mock_keyring: dict[str, str], sample_access_token: str
+    ):
+        """Test requires_auth shares one manager and keeps its client open.
+
+        Args:
+            mock_keyring: Mocked keyring fixture
+            sample_access_token: Sample access token fixture
+        """
+        mock_keyring["claude-bedrock-cursor:access_token"] = sample_access_token
+
+        @oauth.requires_auth
+        async def call_api(access_token: str) -> str:
+            return access_token
+
+        assert await call_api() == sample_access_token
+        manager = oauth._default_manager
+        assert await call_api() == sample_access_token
+
+        assert oauth._default_manager is manager
+        assert not manager.client.is_closed
+
+    def test_requires_auth_manager_per_event_loop(
+        self, mock_keyring: dict[str, str], sample_access_token: str
+    ):
+        """Test requires_auth gets a fresh manager on each new event loop.
+
+        Args:
+            mock_keyring: Mocked keyring fixture
+            sample_access_token: Sample access token fixture
+        """
+        import asyncio
+
+        mock_keyring["claude-bedrock-cursor:access_token"] = sample_access_token
+
+        @oauth.requires_auth
+        async def call_api(access_token: str) -> str:
+            return access_token
+
+        async def default_manager() -> OAuthManager | None:
+            assert await call_api() == sample_access_token
+            return oauth._default_manager
+
+        first = asyncio.run(default_manager())
+        second = asyncio.run(default_manager())
+
+        assert second is not first
+        assert first is not None
+        assert first._refresh_task is None
+
     def test_token_expiry_calculation(self):
         """Test token expiry timestamp calculation."""
         manager = OAuthManager()
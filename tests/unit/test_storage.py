@@ -99,6 +99,52 @@ class TestSecureTokenStorage:
         assert storage.get_token("access_token") is None
         assert storage.get_token("refresh_token") is None
 
+    def test_clear_all_drops_cached_tokens(self, mock_keyring: dict[str, str]):
+        """Test cached tokens are dropped when storage is cleared.
+
+        Args:
+            mock_keyring: Mocked keyring storage fixture
+        """
+        storage = SecureTokenStorage()
+        storage.store_token("access_token", "access_123")
+
+        storage.clear_all()
+
+        assert storage._cache == {}
+        assert storage.get_token("access_token") is None
+
+    async def test_clear_all_async(self, mock_keyring: dict[str, str]):
+        """Test clearing all tokens concurrently.
+
+        Args:
+            mock_keyring: Mocked keyring storage fixture
+        """
+        storage = SecureTokenStorage()
+
+        storage.store_token("access_token", "access_123")
+        storage.store_token("refresh_token", "refresh_456")
+        storage.store_token("access_token_expires_at", "1735689600")
+
+        await storage.clear_all_async()
+
+        assert mock_keyring == {}
+        assert storage.get_token("access_token") is None
+
+    async def test_async_store_and_retrieve_token(self, mock_keyring: dict[str, str]):
+        """Test async shims round-trip through the keyring.
+
+        Args:
+            mock_keyring: Mocked keyring storage fixture
+        """
+        storage = SecureTokenStorage()
+
+        await storage.astore_token("access_token", "async_access")
+
+        assert mock_keyring["claude-bedrock-cursor:access_token"] == "async_access"
+        assert await storage.aget_token("access_token") == "async_access"
+        assert await storage.ahas_token("access_token")
+        assert not await storage.ahas_token("refresh_token")
+
     def test_has_token(self, mock_keyring: dict[str, str]):
         """Test checking if token exists.
 
@@ -233,3 +279,104 @@ class TestSecureTokenStorage:
         assert not storage.has_token("access_token")
         assert not storage.has_token("refresh_token")
         assert not storage.has_token("oauth_token")
+
+    def test_get_token_served_from_cache(
+        self, mock_keyring: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test repeated reads hit the in-memory cache, not the keyring.
+
+        Args:
+            mock_keyring: Mocked keyring storage fixture
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        import keyring
+
+        mock_keyring["claude-bedrock-cursor:access_token"] = "cached_value"
+        calls = 0
+        keyring_get = keyring.get_password
+
+        def counting_get_password(service: str, username: str) -> str | None:
+            nonlocal calls
+            calls += 1
+            return keyring_get(service, username)
+
+        monkeypatch.setattr(keyring, "get_password", counting_get_password)
+        storage = SecureTokenStorage()
+
+        assert storage.get_token("access_token") == "cached_value"
+        assert storage.get_token("access_token") == "cached_value"
+        assert calls == 1
+
+        # Writes go through the cache
+        storage.store_token("access_token", "updated_value")
+        assert storage.get_token("access_token") == "updated_value"
+        storage.delete_token("access_token")
+        assert storage.get_token("access_token") is None
+        assert calls == 2
+
+    def test_missing_token_cached_until_store(
+        self, mock_keyring: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test keyring misses are remembered until a token is stored.
+
+        Args:
+            mock_keyring: Mocked keyring storage fixture
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        import keyring
+
+        calls = 0
+        keyring_get = keyring.get_password
+
+        def counting_get_password(service: str, username: str) -> str | None:
+            nonlocal calls
+            calls += 1
+            return keyring_get(service, username)
+
+        monkeypatch.setattr(keyring, "get_password", counting_get_password)
+        storage = SecureTokenStorage()
+
+        assert not storage.has_token("access_token")
+        assert not storage.has_token("access_token")
+        assert calls == 1
+
+        # Any store (e.g. a login) invalidates recorded misses
+        storage.store_token("refresh_token", "refresh_value")
+        mock_keyring["claude-bedrock-cursor:access_token"] = "access_value"
+        assert storage.get_token("access_token") == "access_value"
+        assert calls == 2
+
+        # Misses expire after MISS_TTL
+        monkeypatch.setattr(SecureTokenStorage, "MISS_TTL", 0)
+        assert storage.get_token("oauth_token") is None
+        assert storage.get_token("oauth_token") is None
+        assert calls == 4
+
+    def test_get_token_fresh_reads_keyring(self, mock_keyring: dict[str, str]):
+        """Test a fresh read sees a value changed behind the cache.
+
+        Args:
+            mock_keyring: Mocked keyring storage fixture
+        """
+        storage = SecureTokenStorage()
+        storage.store_token("refresh_token", "refresh_v1")
+        mock_keyring["claude-bedrock-cursor:refresh_token"] = "refresh_v2"
+
+        assert storage.get_token("refresh_token") == "refresh_v1"
+        assert storage.get_token("refresh_token", fresh=True) == "refresh_v2"
+        assert storage.get_token("refresh_token") == "refresh_v2"
+
+    def test_clear_all_deletes_recently_missing(self, mock_keyring: dict[str, str]):
+        """Test clear_all deletes tokens written after this instance missed them.
+
+        Args:
+            mock_keyring: Mocked keyring storage fixture
+        """
+        storage = SecureTokenStorage()
+        assert storage.get_token("oauth_token") is None
+
+        # Another process (or `claude setup-token`) writes it within MISS_TTL
+        mock_keyring["claude-bedrock-cursor:oauth_token"] = "oauth_elsewhere"
+        storage.clear_all()
+
+        assert "claude-bedrock-cursor:oauth_token" not in mock_keyring